@@ -7,6 +7,7 @@ __actors__ = ["Axis"]
 
 import asyncio
 import logging
+import numpy as np
 
 from typing import Any, Dict, Optional, Union
 
@@ -94,6 +95,12 @@ class Axis(EventActor):
         self._units = u.Unit(units)
         self._units_per_rev = units_per_rev * self._units / u.rev
 
+        # unit conversion caches, see equivalencies and conversion_pairs
+        self._equivalencies_cache = None  # type: Optional[tuple]
+        self._conversion_pairs = None  # type: Optional[list]
+        self._motor_to_axis_units = None  # type: Optional[dict]
+        self._update_conversion_pairs()
+
         super().__init__(
             name=name,
             logger=logger,
@@ -216,6 +223,7 @@ class Axis(EventActor):
 
         self._units_per_rev = self.units_per_rev.to(new_units / u.rev)
         self._units = new_units
+        self._update_conversion_pairs()
 
     @property
     def units_per_rev(self) -> u.Quantity:
@@ -245,10 +253,21 @@ class Axis(EventActor):
         """
         List of unit equivalencies to convert back-and-forth between
         the axis physical units and the motor units.
+
+        The list is cached and only rebuilt when :attr:`units`,
+        :attr:`units_per_rev`, or the motor's :attr:`steps_per_rev`
+        change.
         """
         steps_per_rev = self.steps_per_rev.value
         units_per_rev = self.units_per_rev.value
 
+        cache_key = (steps_per_rev, units_per_rev, self.units)
+        if (
+            self._equivalencies_cache is not None
+            and self._equivalencies_cache[0] == cache_key
+        ):
+            return self._equivalencies_cache[1]
+
         equivs = [
             (
                 u.rev,
@@ -277,21 +296,47 @@ class Axis(EventActor):
                 ]
             )
 
+        self._equivalencies_cache = (cache_key, equivs, {})
         return equivs
 
+    def _conversion_factor(self, from_unit: u.Unit, to_unit: u.Unit):
+        """
+        The factor that converts a value in ``from_unit`` to
+        ``to_unit`` using :attr:`equivalencies`.  Factors are memoized
+        alongside the :attr:`equivalencies` cache, so repeated commands
+        do not go through the `astropy` unit conversion machinery.
+        """
+        equivs = self.equivalencies  # ensures the cache is current
+        factors = self._equivalencies_cache[2]
+
+        try:
+            return factors[(from_unit, to_unit)]
+        except KeyError:
+            factor = from_unit.to(to_unit, equivalencies=equivs)
+            factors[(from_unit, to_unit)] = factor
+            return factor
+
     @property
     def conversion_pairs(self):
         """
         List of conversion pairs between motor units and physical
         units.  For example, ``[(u.steps, self.units), ...]``.
         """
-        return [
+        return self._conversion_pairs
+
+    def _update_conversion_pairs(self):
+        """
+        Rebuild :attr:`conversion_pairs` and the motor unit to axis
+        unit lookup used by :meth:`send_command`.
+        """
+        self._conversion_pairs = [
             (u.steps, self.units),
             (u.steps / u.s, self.units / u.s),
             (u.steps / u.s / u.s, self.units / u.s / u.s),
             (u.rev / u.s, self.units / u.s),
             (u.rev / u.s / u.s, self.units / u.s / u.s),
         ]
+        self._motor_to_axis_units = dict(self._conversion_pairs)
 
     def send_command(self, command, *args):
         """
@@ -314,37 +359,37 @@ class Axis(EventActor):
         # TODO: put this into a separate convert() method that can handle both
         #       the send and recv unit conversion
         if motor_unit is not None and len(args):
-            axis_unit = None
-            for motor_u, axis_u in self.conversion_pairs:
-                if motor_unit == motor_u:
-                    axis_unit = axis_u
-                    break
-
-            if axis_unit is not None:
+            axis_unit = self._motor_to_axis_units.get(motor_unit)
+            if axis_unit is not None and axis_unit != motor_unit:
                 args = list(args)
-                args[0] = args[0] * axis_unit.to(
-                    motor_unit, equivalencies=self.equivalencies
-                )
+                value = args[0]
+                if isinstance(value, u.Quantity):
+                    value = value.to_value(axis_unit)
+
+                # a single factor is applied, so array-like values are
+                # converted in one broadcast multiply
+                args[0] = value * self._conversion_factor(axis_unit, motor_unit)
 
                 # TODO: There should be a cleaner way of enforcing this
                 #       int conversion...maybe add it to the Motor class,
                 #       but I [Erik] currently feel the conversion should
                 #       happen outside the Motor class
                 if motor_unit is u.steps:
-                    args[0] = int(args[0])
+                    args[0] = (
+                        int(args[0])
+                        if np.ndim(args[0]) == 0
+                        else np.asarray(args[0]).astype(np.int64)
+                    )
 
         rtn = self.motor.send_command(command, *args)
 
         # TODO: see detailing todo above
         if hasattr(rtn, "unit"):
-            axis_unit = None
-            for motor_u, axis_u in self.conversion_pairs:
-                if rtn.unit == motor_u:
-                    axis_unit = axis_u
-                    break
-
-            if axis_unit is not None:
-                rtn = rtn.to(axis_unit, equivalencies=self.equivalencies)
+            axis_unit = self._motor_to_axis_units.get(rtn.unit)
+            if axis_unit is not None and axis_unit != rtn.unit:
+                rtn = (
+                    rtn.value * self._conversion_factor(rtn.unit, axis_unit)
+                ) * axis_unit
 
         return rtn
 
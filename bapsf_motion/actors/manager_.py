@@ -8,10 +8,12 @@ __actors__ = ["RunManager"]
 
 import logging
 
-from collections import UserDict
+from collections import Counter, UserDict
+from copy import deepcopy
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Union
 
 from bapsf_motion.actors.base import EventActor
 from bapsf_motion.actors.motion_group_ import (
@@ -21,18 +23,31 @@ from bapsf_motion.actors.motion_group_ import (
 )
 from bapsf_motion.utils import toml, _deepcopy_dict
 
+_rm_logger = logging.getLogger("RM")
+_rm_config_logger = logging.getLogger("RM_config")
 
-class RunManagerConfig(UserDict):
-    _manager_names = {"run"}
-    _mg_names = MotionGroupConfig._mg_names
-    _required_metadata = {"run", "name"}
+
+@lru_cache(maxsize=8)
+def _loads_toml_string(toml_str: str) -> Dict[str, Any]:
+    """
+    Cached `toml.loads`, so re-loading an unchanged TOML string does
+    not re-parse it.  The returned dictionary is shared between calls
+    and must be copied before being modified.
+    """
+    return toml.loads(toml_str)
+
+
+class RunManagerConfig(dict):
+    _manager_names = frozenset({"run"})
+    _mg_names = frozenset(MotionGroupConfig._mg_names)
+    _required_metadata = frozenset({"run", "name"})
 
     def __init__(
         self,
         config: Union[str, Dict[str, Any], "RunManagerConfig", Path],
         logger: logging.Logger = None,
     ):
-        self.logger = logging.getLogger("RM_config") if logger is None else logger
+        self.logger = _rm_config_logger if logger is None else logger
 
         # Make sure config is the right type, and is a dict by the
         # end of ths code block
@@ -43,13 +58,32 @@ class RunManagerConfig(UserDict):
             # we need to deep copy to avoid passing around actor objects
             # from the old config
             config = _deepcopy_dict(config)
+
+            # the run level configuration has already been validated,
+            # only the motion group configurations need to be rebuilt
+            # since they were converted to dicts during the copy
+            config["date"] = self._timestamp()
+            config["motion_group"] = {
+                index: MotionGroupConfig(mgc)
+                for index, mgc in enumerate(config["motion_group"].values())
+            }
+            self._mgs = None
+
+            super().__init__(config)
+            return
         elif isinstance(config, str):
             # could be path to TOML file or a TOML like string
-            if Path(config).exists():
+            try:
+                is_file = Path(config).exists()
+            except OSError:
+                # e.g. a TOML string that is too long to be a file name
+                is_file = False
+
+            if is_file:
                 with open(config, "rb") as f:
                     config = toml.load(f)
             else:
-                config = toml.loads(config)
+                config = deepcopy(_loads_toml_string(config))
         elif isinstance(config, Path):
             # path to TOML file
             with open(config, "rb") as f:
@@ -61,17 +95,15 @@ class RunManagerConfig(UserDict):
 
         # Check if the configuration has a data run header or just
         # the configuration
-        if len(self._manager_names - set(config.keys())) < len(self._manager_names) - 1:
+        man_names_in_config = self._manager_names & config.keys()
+        if len(man_names_in_config) > 1:
             raise ValueError(
                 "Unable to interpret configuration, since there appears"
                 " to be multiple data run configurations supplied."
             )
-        elif (len(self._manager_names - set(config.keys()))
-              == len(self._manager_names) - 1):
+        elif len(man_names_in_config) == 1:
             # data run found in config
-            man_name = tuple(
-                self._manager_names - (self._manager_names - set(config.keys()))
-            )[0]
+            man_name = next(iter(man_names_in_config))
             config = config[man_name]
 
             if not isinstance(config, dict):
@@ -85,26 +117,16 @@ class RunManagerConfig(UserDict):
         self._mgs = None  # type: Union[None, Dict[Union[str, int], MotionGroup]]
 
         super().__init__(config)
-        self._data = self.data
 
-    @property
-    def data(self):
-        """
-        A real dictionary used to store the contents of
-        `RunManagerConfig`.
-        """
-        if self._mgs is not None:
-            for key, mg in self._mgs.items():
-                self._data["motion_group"][key] = mg.config
-
-        return self._data
-
-    @data.setter
-    def data(self, value):
-        self._data = value
+    @staticmethod
+    def _timestamp() -> str:
+        """The current UTC date and time used for the ``date`` entry."""
+        # the timezone is always UTC, so skip the %Z tz-name lookup
+        now = datetime.now(timezone.utc)
+        return f"{now:%Y-%m-%d %H:%M} UTC"
 
     def _validate_config(self, config):
-        date = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M %Z')
+        date = self._timestamp()
         if "name" not in config:
             rname = f"run [{date}]"
             self.logger.warning(
@@ -121,8 +143,8 @@ class RunManagerConfig(UserDict):
         config["date"] = date
 
         # Are there motion groups
-        mg_names_not_in_config = self._mg_names - set(config)
-        if len(mg_names_not_in_config) == len(self._mg_names):
+        mg_names_in_config = self._mg_names & config.keys()
+        if not mg_names_in_config:
             self.logger.error(
                 "ValueError: The run configuration has no defined motion groups, "
                 "there needs to be at least one motion group."
@@ -132,9 +154,30 @@ class RunManagerConfig(UserDict):
             return config
 
         # collect possible motion group configurations
-        mg_names_in_config = self._mg_names - mg_names_not_in_config
-        collected_mg_configs = {}
-        for mg_name in mg_names_in_config:
+        collected_mg_configs = list(
+            self._iter_mg_configs(config, mg_names_in_config)
+        )
+
+        config = self._handle_user_meta(config, {"name", "date"})
+        # an existing MotionGroupConfig has already been validated
+        config["motion_group"] = {
+            index: (
+                mgc if isinstance(mgc, MotionGroupConfig)
+                else MotionGroupConfig(mgc)
+            )
+            for index, mgc in enumerate(collected_mg_configs)
+        }
+
+        config = self._validate_motion_groups(config)
+
+        return config
+
+    def _iter_mg_configs(self, config: Dict[str, Any], mg_names: Iterable[str]):
+        """
+        Pop the motion group entries ``mg_names`` from ``config`` and
+        yield each motion group configuration they contain.
+        """
+        for mg_name in mg_names:
             mg_config = config.pop(mg_name)
 
             if not isinstance(mg_config, (dict, UserDict)):
@@ -146,8 +189,7 @@ class RunManagerConfig(UserDict):
 
             if "name" in mg_config:
                 # assume only one motion group is defined
-                index = len(collected_mg_configs)
-                collected_mg_configs[index] = mg_config
+                yield mg_config
                 continue
 
             for mgc in mg_config.values():
@@ -159,80 +201,60 @@ class RunManagerConfig(UserDict):
                     )
                     continue
 
-                index = len(collected_mg_configs)
-                collected_mg_configs[index] = mgc
-
-        config = self._handle_user_meta(config, {"name", "date"})
-        config["motion_group"] = {}
-
-        for key, val in collected_mg_configs.items():
-            config["motion_group"][key] = MotionGroupConfig(val)
-
-        config = self._validate_motion_group_names(config)
-        config = self._validate_drive_ips(config)
+                yield mgc
 
-        return config
+    def _validate_motion_groups(self, config: Dict[str, Any]):
+        """
+        Remove motion groups with duplicate names, then remove the
+        remaining motion groups that share a motor IP address.
+        """
+        if len(config["motion_group"]) < 2:
+            # nothing to deduplicate, axis IPs within a single motion
+            # group are already validated by MotionGroupConfig
+            return config
 
-    def _validate_motion_group_names(self, config: Dict[str, Any]):
-        mg_config_names = [val["name"] for val in config["motion_group"].values()]
-        if len(set(mg_config_names)) != len(mg_config_names):
-            duplicates = []
-            for name in set(mg_config_names):
-                count = mg_config_names.count(name)
-                if count != 1:
-                    duplicates.append(name)
+        mg_names = {}
+        mg_ips = {}
+        for key, val in config["motion_group"].items():
+            mg_names[key] = val["name"]
+            mg_ips[key] = [ax["ip"] for ax in val["drive"]["axes"].values()]
 
+        name_counts = Counter(mg_names.values())
+        duplicates = [name for name, count in name_counts.items() if count > 1]
+        if duplicates:
             self.logger.error(
-                f"ValueError: All configured motion groups must have unique names, "
-                f"found duplicates for {duplicates}.  Remove motion groups with "
-                f"duplicate names."
+                f"ValueError: All configured motion groups must have unique "
+                f"names, found duplicates for {duplicates}.  Remove motion "
+                f"groups with duplicate names."
             )
 
-            new_mg_config = {}
-            for key, val in config["motion_group"].items():
-                if val["name"] in duplicates:
-                    continue
-
-                new_mg_config[key] = val
-
-            config["motion_group"] = new_mg_config
-
-        return config
-
-    def _validate_drive_ips(self, config: Dict[str, Any]):
-        drive_configs = [val["drive"] for val in config["motion_group"].values()]
-        drive_ips = []
-        for dr in drive_configs:
-            ips = [val["ip"] for val in dr["axes"].values()]
-            drive_ips.extend(ips)
-
-        if len(set(drive_ips)) != len(drive_ips):
-            duplicates = []
-            for ip in set(drive_ips):
-                count = drive_ips.count(ip)
-                if count != 1:
-                    duplicates.append(ip)
+            duplicates = set(duplicates)
+            mg_ips = {
+                key: ips
+                for key, ips in mg_ips.items()
+                if mg_names[key] not in duplicates
+            }
 
+        ip_counts = Counter(ip for ips in mg_ips.values() for ip in ips)
+        duplicates = [ip for ip, count in ip_counts.items() if count > 1]
+        if duplicates:
             self.logger.error(
-                f"ValueError: All configured motion groups must have unique motor IP "
-                f"addresses, found  duplicates for {duplicates}.  Removing "
-                f"motion groups with shared IPs."
+                f"ValueError: All configured motion groups must have unique "
+                f"motor IP addresses, found  duplicates for {duplicates}.  "
+                f"Removing motion groups with shared IPs."
             )
 
-            new_mg_configs = {}
-            for key, val in config["motion_group"].items():
-                dr = val["drive"]
-
-                remove = False
-                for ax in dr["axes"].values():
-                    if ax["ip"] in duplicates:
-                        remove = True
-                        break
+            duplicates = set(duplicates)
+            mg_ips = {
+                key: ips
+                for key, ips in mg_ips.items()
+                if duplicates.isdisjoint(ips)
+            }
 
-                if not remove:
-                    new_mg_configs[key] = val
-                else:
-                    remove = False
+        if len(mg_ips) != len(config["motion_group"]):
+            config["motion_group"] = {
+                key: config["motion_group"][key] for key in mg_ips
+            }
 
         return config
 
@@ -257,6 +279,10 @@ class RunManagerConfig(UserDict):
         else:
             self._mgs[key] = mg
 
+        # MotionGroup.config is the live configuration object of the
+        # motion group, so it only needs to be stored once
+        self["motion_group"][key] = mg.config
+
     def unlink_motion_group(self, key):
         """Unlink and remove motion group from the configuration."""
         if self._mgs is not None:
@@ -290,12 +316,11 @@ class RunManager(EventActor):
         build_mode: bool = False,
         parent: Optional["EventActor"] = None,
     ):
-        self._mgs = None
+        self._mgs = {}  # type: Dict[Union[str, int], MotionGroup]
         self._config = None
 
-        logger = logging.getLogger("RM")
         super().__init__(
-            logger=logger,
+            logger=_rm_logger,
             auto_run=False,
             parent=parent
         )
@@ -307,7 +332,7 @@ class RunManager(EventActor):
             if not build_mode:
                 raise err
 
-            self.logger.error(f"{err.__class_.__name__}: {err}")
+            self.logger.error(f"{err.__class__.__name__}: {err}")
 
             config = RunManagerConfig(
                 config={"name": "Run Build"},
@@ -331,7 +356,7 @@ class RunManager(EventActor):
     def run(self, auto_run=True):
         super().run(auto_run=auto_run)
 
-        if self.mgs is None or not self.mgs:
+        if not self._mgs:
             return
 
         for mg in self.mgs.values():
@@ -340,9 +365,6 @@ class RunManager(EventActor):
     
     @property
     def mgs(self) -> Dict[Union[str, int], MotionGroup]:
-        if self._mgs is None:
-            self._mgs = {}
-        
         return self._mgs
 
     @property
@@ -366,7 +388,7 @@ class RunManager(EventActor):
 
     @property
     def is_moving(self):
-        return any([mg.is_moving for mg in self.mgs.values()])
+        return any(mg.is_moving for mg in self._mgs.values())
 
     def validate_motion_group(
         self,
@@ -403,7 +425,7 @@ class RunManager(EventActor):
             config = mg_config
 
         mg = self._spawn_motion_group(config)
-        self.mgs[identifier] = mg
+        self._mgs[identifier] = mg
         self.config.link_motion_group(mg, identifier)
 
     def add_motion_group(
@@ -739,7 +739,7 @@ class MotionGroup(EventActor):
             if not build_mode:
                 raise err
 
-            self.logger.error(f"{err.__class_.__name__}: {err}")
+            self.logger.error(f"{err.__class__.__name__}: {err}")
 
             config = MotionGroupConfig(
                 config={"name": "A Motion Group"},
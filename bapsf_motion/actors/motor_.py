@@ -16,7 +16,8 @@ import time
 
 from collections import UserDict
 from enum import Enum
-from typing import Any, AnyStr, Callable, Dict, NamedTuple, Optional, Union
+from types import MappingProxyType
+from typing import Any, AnyStr, Callable, Dict, List, NamedTuple, Optional, Union
 
 from bapsf_motion.actors.base import EventActor
 from bapsf_motion.utils import ipv4_pattern, SimpleSignal
@@ -111,7 +112,7 @@ class CommandEntry(UserDict):
             "speed",
             send="VE",
             send_processor=lambda value: f"{float(value):.4f}",
-            recv=re.compile(r"VE=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"VE=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s,
@@ -179,6 +180,25 @@ class CommandEntry(UserDict):
         return self._command
 
 
+class _CommandSpec(NamedTuple):
+    """
+    A flat, read-only view of a `CommandEntry`, so looking up a command
+    attribute is a tuple attribute access instead of a
+    `~collections.UserDict` item lookup.
+    """
+    send: Optional[str]
+    send_processor: Optional[Callable[[Any], str]]
+    recv: Optional["re.Pattern"]
+    recv_processor: Optional[Callable[[str], Any]]
+    two_way: bool
+    units: Union[str, u.Unit, None]
+    method_command: bool
+
+    @classmethod
+    def from_entry(cls, entry: CommandEntry) -> "_CommandSpec":
+        return cls(*(entry.get(field) for field in cls._fields))
+
+
 class Motor(EventActor):
     """
     An actor class for directly communicating to an ethernet based
@@ -255,7 +275,7 @@ class Motor(EventActor):
             "acceleration",
             send="AC",
             send_processor=lambda value: f"{float(value):.3f}",
-            recv=re.compile(r"AC=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"AC=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s / u.s,
@@ -263,7 +283,7 @@ class Motor(EventActor):
         "alarm": CommandEntry(
             "alarm",
             send="AL",
-            recv=re.compile(r"AL=(?P<return>[0-9]{4})"),
+            recv=re.compile(r"AL=(?P<return>[0-9A-Fa-f]{4})", re.ASCII),
         ),
         "alarm_reset": CommandEntry(
             "alarm_reset",
@@ -272,7 +292,7 @@ class Motor(EventActor):
         "buffer_size": CommandEntry(
             "buffer_size",
             send="BS",
-            recv=re.compile(r"BS=(?P<return>[0-9]\.?[0-9]?)"),
+            recv=re.compile(r"BS=(?P<return>[0-9]\.?[0-9]?)", re.ASCII),
             recv_processor=int,
         ),
         "commence_jogging": CommandEntry("commence_jogging", send="CJ"),
@@ -285,7 +305,7 @@ class Motor(EventActor):
             "change_current",
             send="CC",
             send_processor=lambda value: f"{float(value):.1f}",
-            recv=re.compile(r"CC=(?P<return>[0-9]\.?[0-9]?)"),
+            recv=re.compile(r"CC=(?P<return>[0-9]\.?[0-9]?)", re.ASCII),
             recv_processor=float,
             two_way=True,
         ),
@@ -293,7 +313,7 @@ class Motor(EventActor):
             "deceleration",
             send="DE",
             send_processor=lambda value: f"{float(value):.3f}",
-            recv=re.compile(r"DE=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"DE=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s / u.s,
@@ -302,7 +322,7 @@ class Motor(EventActor):
             "define_limits",
             send="DL",
             send_processor=lambda value: f"{int(value)}",
-            recv=re.compile(r"DL=(?P<return>[0-9])"),
+            recv=re.compile(r"DL=(?P<return>[0-9])", re.ASCII),
             recv_processor=int,
             two_way=True,
         ),
@@ -312,7 +332,7 @@ class Motor(EventActor):
             "encoder_position",
             send="EP",
             send_processor=lambda value: f"{int(value)}",
-            recv=re.compile(r"EP=(?P<return>[0-9]+)"),
+            recv=re.compile(r"EP=(?P<return>[0-9]+)", re.ASCII),
             recv_processor=int,
             two_way=True,
             units=u.counts,
@@ -320,7 +340,7 @@ class Motor(EventActor):
         "encoder_resolution": CommandEntry(
             "encoder_resolution",
             send="ER",
-            recv=re.compile(r"ER=(?P<return>[0-9]+)"),
+            recv=re.compile(r"ER=(?P<return>[0-9]+)", re.ASCII),
             recv_processor=int,
             units=u.counts / u.rev,
         ),
@@ -328,14 +348,14 @@ class Motor(EventActor):
         "gearing": CommandEntry(
             "gearing",
             send="EG",
-            recv=re.compile(r"EG=(?P<return>[0-9]+)"),
+            recv=re.compile(r"EG=(?P<return>[0-9]+)", re.ASCII),
             recv_processor=int,
             units=u.steps / u.rev,
         ),
         "get_position": CommandEntry(
             "immediate_position",
             send="IP",
-            recv=re.compile(r"IP=(?P<return>-?[0-9]+)"),
+            recv=re.compile(r"IP=(?P<return>-?[0-9]+)", re.ASCII),
             recv_processor=int,
             units=u.steps,
         ),
@@ -343,7 +363,7 @@ class Motor(EventActor):
             "change_idle_current",
             send="CI",
             send_processor=lambda value: f"{float(value):.1f}",
-            recv=re.compile(r"CI=(?P<return>[0-9]\.?[0-9]?)"),
+            recv=re.compile(r"CI=(?P<return>[0-9]\.?[0-9]?)", re.ASCII),
             recv_processor=float,
             two_way=True,
         ),
@@ -351,7 +371,7 @@ class Motor(EventActor):
             "jog_acceleration",
             send="JA",
             send_processor=lambda value: f"{float(value):.3f}",
-            recv=re.compile(r"JA=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"JA=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s / u.s,
@@ -360,7 +380,7 @@ class Motor(EventActor):
             "jog_deceleration",
             send="JL",
             send_processor=lambda value: f"{float(value):.3f}",
-            recv=re.compile(r"JL=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"JL=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s / u.s,
@@ -369,7 +389,7 @@ class Motor(EventActor):
             "jog_speed",
             send="JS",
             send_processor=lambda value: f"{float(value):.4f}",
-            recv=re.compile(r"JS=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"JS=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s,
@@ -393,14 +413,14 @@ class Motor(EventActor):
             "protocol",
             send="PR",
             send_processor=lambda value: f"{int(value)}",
-            recv=re.compile(r"PR=(?P<return>[0-9]{1,3})"),
+            recv=re.compile(r"PR=(?P<return>[0-9]{1,3})", re.ASCII),
             recv_processor=int,
             two_way=True,
         ),
         "request_status": CommandEntry(
             "request_status",
             send="RS",
-            recv=re.compile(r"RS=(?P<return>[ADEFHJMPRSTW]+)"),
+            recv=re.compile(r"RS=(?P<return>[ADEFHJMPRSTW]+)", re.ASCII),
         ),
         "reset_currents": CommandEntry(
             "reset_currents",
@@ -437,7 +457,7 @@ class Motor(EventActor):
             "set_position_SP",
             send="SP",
             send_processor=lambda value: f"{int(value)}",
-            recv=re.compile(r"SP=(?P<return>[0-9]+)"),
+            recv=re.compile(r"SP=(?P<return>[0-9]+)", re.ASCII),
             recv_processor=int,
             two_way=True,
             units=u.steps,
@@ -446,7 +466,7 @@ class Motor(EventActor):
             "speed",
             send="VE",
             send_processor=lambda value: f"{float(value):.4f}",
-            recv=re.compile(r"VE=(?P<return>[0-9]+\.?[0-9]*)"),
+            recv=re.compile(r"VE=(?P<return>[0-9]+\.?[0-9]*)", re.ASCII),
             recv_processor=float,
             two_way=True,
             units=u.rev / u.s,
@@ -460,7 +480,7 @@ class Motor(EventActor):
             "target_distance",
             send="DI",
             send_processor=lambda value: f"{int(value)}",
-            recv=re.compile(r"DI=(?P<return>[0-9]+)"),
+            recv=re.compile(r"DI=(?P<return>[0-9]+)", re.ASCII),
             recv_processor=int,
             two_way=True,
             units=u.steps,
@@ -473,23 +493,72 @@ class Motor(EventActor):
         ),
     }  # type: Dict[str, Optional[Dict[str, Any]]]
 
-    #: mapping of motor alarm codes to their descriptive message (specific to STM motors)
+    #: flattened `_commands` used when sending and receiving commands
+    _command_specs = {
+        command: _CommandSpec.from_entry(entry)
+        for command, entry in _commands.items()
+    }  # type: Dict[str, _CommandSpec]
+
+    #: fully framed bytes (header + command + end-of-message) for every
+    #: base command string, i.e. commands sent without an argument
+    _command_frames = {
+        spec.send: b"\x00\x07" + spec.send.encode("ASCII") + b"\r"
+        for spec in _command_specs.values()
+        if spec.send
+    }  # type: Dict[str, bytes]
+
+    #: mapping of motor alarm code bits to their descriptive message (specific
+    #: to STM motors), the motor returns the alarm code as a hex bitfield
     _alarm_codes = {
-        1: "position limit [Drive Fault]",
-        2: "CCW limit",
-        4: "CW limit",
-        8: "over temp  [Drive Fault]",
-        10: "internal voltage [Drive Fault]",
-        20: "over voltage [Drive Fault]",
-        40: "under voltage",
-        80: "over current [Drive Fault]",
-        100: "open motor winding [Drive Fault]",
-        400: "common error",
-        800: "bad flash",
-        1000: "no move",
-        4000: "blank Q segment",
+        0x0001: "position limit [Drive Fault]",
+        0x0002: "CCW limit",
+        0x0004: "CW limit",
+        0x0008: "over temp  [Drive Fault]",
+        0x0010: "internal voltage [Drive Fault]",
+        0x0020: "over voltage [Drive Fault]",
+        0x0040: "under voltage",
+        0x0080: "over current [Drive Fault]",
+        0x0100: "open motor winding [Drive Fault]",
+        0x0400: "common error",
+        0x0800: "bad flash",
+        0x1000: "no move",
+        0x4000: "blank Q segment",
+    }
+
+    #: status values when the motor reports no status flags (read-only,
+    #: copy before modifying)
+    _null_status = MappingProxyType({
+        "alarm": False,
+        "enabled": False,
+        "fault": False,
+        "moving": False,
+        "homing": False,
+        "jogging": False,
+        "motion_in_progress": False,
+        "in_position": False,
+        "stopping": False,
+        "waiting": False,
+    })
+
+    #: mapping of ``request_status`` flags to the status (key, value) they set
+    _status_flags = {
+        "A": ("alarm", True),
+        "D": ("enabled", False),
+        "E": ("fault", True),
+        "F": ("moving", True),
+        "H": ("homing", True),
+        "J": ("jogging", True),
+        "M": ("motion_in_progress", True),
+        "P": ("in_position", True),
+        "R": ("enabled", True),
+        "S": ("stopping", True),
+        "T": ("waiting", True),
+        "W": ("waiting", True),
     }
 
+    #: pattern for parsing the error code out of a Nack response
+    _nack_pattern = re.compile(r"\d?\?(?P<code>\d{1,2})", re.ASCII)
+
     #: mapping of motor Ack/Nack codes and their descriptive messages
     _nack_codes = {
         1: "command timed out",
@@ -558,6 +627,12 @@ class Motor(EventActor):
         self._status = self._status_defaults.copy()
         self._limit_mode = limit_mode
 
+        # preallocated buffer for socket reads, and any bytes received
+        # beyond the end of the last returned message
+        self._recv_buffer = bytearray(1024)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._recv_pending = bytearray()
+
         # simple signal to tell handlers that _status changed
         self.status_changed = SimpleSignal()
         self.movement_started = SimpleSignal()
@@ -908,6 +983,7 @@ class Motor(EventActor):
             raise TypeError(f"Expected type {socket.socket}, got type {type(value)}.")
 
         self._setup["socket"] = value
+        self._recv_pending.clear()
 
     @property
     def is_moving(self) -> bool:
@@ -995,16 +1071,19 @@ class Motor(EventActor):
         """
         Update ``self._status` dictionary with the given arguments ``**values``.
         """
-        old_status = self.status.copy()
-        new_status = {**old_status, **values}
-        changed = {}
-        for key, value in new_status.items():
-            if key not in old_status or (key in old_status and old_status[key] != value):
-                changed[key] = value
+        # only the given values can have changed, and the status dict
+        # is replaced (not mutated) so readers always see a consistent
+        # snapshot
+        old_status = self._status
+        changed = {
+            key: value
+            for key, value in values.items()
+            if key not in old_status or old_status[key] != value
+        }
 
         if changed:
-            self._status = new_status
-            self.logger.debug(f"Motor status changed, new values are {changed}.")
+            self._status = {**old_status, **changed}
+            self.logger.debug("Motor status changed, new values are %s.", changed)
             self.status_changed.emit()
 
     def connect(self):
@@ -1046,6 +1125,10 @@ class Motor(EventActor):
                 socket.setdefaulttimeout(3)
                 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 s.settimeout(1)  # 1 second timeout
+                # motor commands are tiny and latency sensitive, so do
+                # not let Nagle's algorithm hold them back
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
                 s.connect((self.ip, self.port))
 
                 msg = "...SUCCESS!!!"
@@ -1082,11 +1165,8 @@ class Motor(EventActor):
             self._configure_motor()
             self._get_motor_parameters()
 
-    def _send_command(self, command, *args):
-        """
-        A low level method for sending commands to the motor, and
-        receiving the response.
-        """
+    def _ensure_heartbeat(self):
+        """Start the heartbeat if the event loop is running without one."""
         if self.loop.is_running() and (
             self.heartbeat_task is None
             or self.heartbeat_task.done()
@@ -1094,6 +1174,13 @@ class Motor(EventActor):
         ):
             self.start_heartbeat()
 
+    def _send_command(self, command, *args):
+        """
+        A low level method for sending commands to the motor, and
+        receiving the response.
+        """
+        self._ensure_heartbeat()
+
         try:
             cmd_str = self._process_command(command, *args)
             recv_str = self._send_raw_command(cmd_str) if "?" not in cmd_str else cmd_str
@@ -1122,6 +1209,76 @@ class Motor(EventActor):
         """A coroutine_ version of :meth:`_send_command`."""
         return self._send_command(command, *args)
 
+    def _send_commands(self, *commands: str) -> List[Any]:
+        """
+        A low level method for sending several argument-less commands
+        to the motor in a single write, and then receiving their
+        responses.  The processed responses are returned in the same
+        order as ``commands``.
+        """
+        self._ensure_heartbeat()
+
+        try:
+            self._send(*[self._process_command(command) for command in commands])
+
+            # Do NOT resync while reading, that would consume the
+            # responses of the later commands.  An out of sync response
+            # only marks its own command as MALFORMED.
+            rtns = []
+            for command in commands:
+                recv_str = self._recv().decode("ASCII")
+                rtns.append(
+                    self._process_command_return(
+                        command, recv_str=recv_str, resync=False
+                    )
+                )
+
+        except (ConnectionError, TimeoutError, OSError) as err:
+            self.logger.error(
+                f"Last commands {commands} were not executed.",
+                exc_info=err,
+            )
+
+            rtns = [self.ack_flags.LOST_CONNECTION] * len(commands)
+            self._update_status(connected=False)
+            return rtns
+
+        # the command and motor buffer came out of sync, re-send the
+        # affected commands one at a time so _send_command() can resync
+        for ii, (command, rtn) in enumerate(zip(commands, rtns)):
+            if rtn == self.ack_flags.MALFORMED:
+                rtns[ii] = self._send_command(command)
+
+        return rtns
+
+    async def _send_commands_async(self, *commands: str) -> List[Any]:
+        """A coroutine_ version of :meth:`_send_commands`."""
+        return self._send_commands(*commands)
+
+    def _run_threadsafe(self, func, coro_func, *args, thread_id=None):
+        """
+        Call ``func(*args)`` directly if the `event loop`_ is not
+        running, otherwise run ``coro_func(*args)`` in the `event loop`_.
+        """
+        if not self.loop.is_running():
+            # event loop not running, just send commands directly
+            return func(*args)
+
+        elif (
+            (thread_id is not None and threading.current_thread().ident == thread_id)
+            or (threading.current_thread().ident == self._thread_id)
+        ):
+            # we are in the same thread as the running event loop, just
+            # send the command directly
+            tk = self.loop.create_task(coro_func(*args))
+            self.loop.run_until_complete(tk)
+            return tk.result()
+
+        # the event loop is running and the command is being sent from
+        # outside the event loop thread
+        future = asyncio.run_coroutine_threadsafe(coro_func(*args), self.loop)
+        return future.result(5)
+
     def send_command(self, command: str, *args, thread_id=None):
         """
         Send ``command`` to the motor, and receive its response.  If the
@@ -1145,32 +1302,18 @@ class Motor(EventActor):
                 f"motor has been terminated."
             )
 
-        if self._commands[command]["method_command"]:
+        if self._command_specs[command].method_command:
             # execute respectively named method
             meth = getattr(self, command)
             return meth(*args)
 
-        elif not self.loop.is_running():
-            # event loop not running, just send commands directly
-            return self._send_command(command, *args)
-
-        elif (
-            (thread_id is not None and threading.current_thread().ident == thread_id)
-            or (threading.current_thread().ident == self._thread_id)
-        ):
-            # we are in the same thread as the running event loop, just
-            # send the command directly
-            tk = self.loop.create_task(self._send_command_async(command, *args))
-            self.loop.run_until_complete(tk)
-            return tk.result()
-
-        # the event loop is running and the command is being sent from
-        # outside the event loop thread
-        future = asyncio.run_coroutine_threadsafe(
-            self._send_command_async(command, *args),
-            self.loop
+        return self._run_threadsafe(
+            self._send_command,
+            self._send_command_async,
+            command,
+            *args,
+            thread_id=thread_id,
         )
-        return future.result(5)
 
     def _process_command(self, command: str, *args) -> str:
         """
@@ -1200,10 +1343,10 @@ class Motor(EventActor):
         "VE 5.5000"
 
         """
-        cmd_dict = self._commands[command]
-        cmd_str = cmd_dict["send"]
+        spec = self._command_specs[command]
+        cmd_str = spec.send
 
-        processor = self._commands[command]["send_processor"]
+        processor = spec.send_processor
         if processor is None:
             # If "send_processor" is None, then it is assumed no values
             # need to be sent with the command.
@@ -1214,8 +1357,7 @@ class Motor(EventActor):
                 )
             return cmd_str
 
-        two_way = cmd_dict.get("two_way", False)
-        if not len(args) and two_way:
+        if not len(args) and spec.two_way:
             # command is being used as a getter instead of a setter
             return cmd_str
         elif not len(args):
@@ -1258,7 +1400,8 @@ class Motor(EventActor):
 
         """
 
-        _send_str = self._commands[command]["send"]
+        spec = self._command_specs[command]
+        _send_str = spec.send
 
         if "%" in rtn_str:
             # Motor acknowledge and executed command.
@@ -1268,9 +1411,7 @@ class Motor(EventActor):
             return self.ack_flags.ACK_QUEUED
         elif "?" in rtn_str:
             # Motor negatively acknowledge command, error in command
-            err_code = re.compile(
-                r"\d?\?(?P<code>\d{1,2})"
-            ).fullmatch(rtn_str).group("code")
+            err_code = self._nack_pattern.fullmatch(rtn_str).group("code")
             err_code = int(err_code)
             err_msg = f"{err_code} - {self._nack_codes[err_code]}"
             self.logger.error(
@@ -1284,33 +1425,41 @@ class Motor(EventActor):
             )
             return self.ack_flags.MALFORMED
 
-        recv_pattern = self._commands[command]["recv"]
+        recv_pattern = spec.recv
         if recv_pattern is not None:
             rtn_str = recv_pattern.fullmatch(rtn_str).group("return")
 
-        processor = self._commands[command]["recv_processor"]
-        rtn = processor(rtn_str)
+        rtn = spec.recv_processor(rtn_str)
 
-        units = self._commands[command]["units"]
+        units = spec.units
         if units is not None:
             return rtn * units
 
         return rtn
 
-    def _process_command_return(self, command: str, *args, recv_str: str) -> Any:
+    def _process_command_return(
+        self, command: str, *args, recv_str: str, resync: bool = True
+    ) -> Any:
+        """
+        Process the motor response ``recv_str`` to ``command``.  If the
+        response does not belong to ``command`` and ``resync`` is
+        `True`, then further responses are received until the command
+        and motor buffer are back in sync.  If ``resync`` is `False`,
+        then ``MALFORMED`` is returned instead.
+        """
         _rtn = self._process_command_return_string(command, recv_str)
 
         if (
                 len(args) == 0
                 and (_rtn == self.ack_flags.ACK or _rtn == self.ack_flags.ACK_QUEUED)
-                and self._commands[command]["recv"] is not None
+                and self._command_specs[command].recv is not None
         ):
             # command had NO arguments and expected a response with data
             # suspecting the command got buffered and acknowledge, and the
             # real data is coming in a followup communication
             _rtn = self.ack_flags.MALFORMED
 
-        if _rtn != self.ack_flags.MALFORMED:
+        if _rtn != self.ack_flags.MALFORMED or not resync:
             return _rtn
 
         while _rtn == self.ack_flags.MALFORMED:
@@ -1357,16 +1506,17 @@ class Motor(EventActor):
             )
             return self.ack_flags.LOST_CONNECTION
 
-    def _send(self, cmd: str):
+    def _send(self, *cmds: str):
         """
-        Low-level functionality to send a command string ``cmd`` to
+        Low-level functionality to send command strings ``cmds`` to
         the motor.  Proper headers and end-of-message (eom) blocks are
-        added to the command string.
+        added to each command string, and all commands are sent in a
+        single write.
 
         Parameters
         ----------
-        cmd: str
-            The command str to be sent to the motor.
+        *cmds: str
+            The command str(s) to be sent to the motor.
         """
         # all messages sent or received over TCP/UDP for Applied Motion Motors
         # use a byte header b'\x00\x07' and end-of-message b'\r'
@@ -1374,8 +1524,11 @@ class Motor(EventActor):
         _header = b"\x00\x07"
         _eom = b"\r"  # end of message
 
-        cmd_str = _header + bytes(cmd.encode("ASCII")) + _eom
-        self.logger.debug(f"Sending command string '{cmd_str}'.")
+        cmd_str = b"".join(
+            self._command_frames.get(cmd) or _header + cmd.encode("ASCII") + _eom
+            for cmd in cmds
+        )
+        self.logger.debug("Sending command string '%s'.", cmd_str)
         try:
             self.socket.sendall(cmd_str)
         except (ConnectionError, OSError) as err:
@@ -1422,22 +1575,28 @@ class Motor(EventActor):
         _header = b"\x00\x07"
         _eom = b"\r"  # end of message
 
-        msg = b""
+        pending = self._recv_pending
         while True:
-            data = self.socket.recv(16)
-
-            if not data:
+            end = pending.find(_eom)
+            if end != -1:
                 break
-            elif not msg and _header in data:
-                msg = data.split(_header)[1]
-            else:
-                msg += data
 
-            if _eom in msg:
-                msg = msg.split(_eom)[0]
+            nbytes = self.socket.recv_into(self._recv_view)
+            if not nbytes:
+                # connection closed, return whatever was received
+                end = len(pending)
                 break
 
-        self.logger.debug(f"Received string '{msg}'.")
+            pending += self._recv_view[:nbytes]
+
+        start = pending.find(_header, 0, end)
+        start = 0 if start == -1 else start + len(_header)
+        msg = bytes(pending[start:end])
+
+        # keep anything beyond this message for the next call
+        del pending[:end + len(_eom)]
+
+        self.logger.debug("Received string '%s'.", msg)
         return msg
 
     def retrieve_motor_status(self, direct_send=False):
@@ -1450,16 +1609,26 @@ class Motor(EventActor):
             If `True`, then the motor commands will bypass any active
             `event loop`_ and be directly sent to the motor.  If
             `False`, then all motor commands will be routed through the
-            :meth:`send_command` method. (DEFAULT: `False`)
+            `event loop`_, like :meth:`send_command`. (DEFAULT: `False`)
 
         """
         # TODO: How to document all the statuses that get updated with this method?
         #
-        # this is done so self._heartbeat can directly send commands since
-        # the heartbeat is already running in the event loop
-        send_command = self._send_command if direct_send else self.send_command
+        # direct_send is done so self._heartbeat can directly send commands
+        # since the heartbeat is already running in the event loop
+        #
+        # all status commands are sent in a single write, and their
+        # responses read back afterward, instead of one round trip per
+        # command
+        status_commands = ("request_status", "get_position", "alarm_reset", "alarm")
+        if direct_send:
+            rtns = self._send_commands(*status_commands)
+        else:
+            rtns = self._run_threadsafe(
+                self._send_commands, self._send_commands_async, *status_commands
+            )
+        _rtn, pos, _, alarm_rtn = rtns
 
-        _rtn = send_command("request_status")
         if isinstance(_rtn, self.ack_flags):
             if _rtn == self.ack_flags.LOST_CONNECTION:
                 return
@@ -1467,53 +1636,22 @@ class Motor(EventActor):
             _rtn = ""
             _status = {}
         else:
-            _status = {
-                "alarm": False,
-                "enabled": False,
-                "fault": False,
-                "moving": False,
-                "homing": False,
-                "jogging": False,
-                "motion_in_progress": False,
-                "in_position": False,
-                "stopping": False,
-                "waiting": False,
-            }  # null status
+            _status = self._null_status.copy()
+
+        status_flags = self._status_flags
         for letter in _rtn:
-            if letter == "A":
-                _status["alarm"] = True
-            elif letter in ("D", "R"):
-                _status["enabled"] = True if letter == "R" else False
-            elif letter == "E":
-                _status["fault"] = True
-            elif letter == "F":
-                _status["moving"] = True
-            elif letter == "H":
-                _status["homing"] = True
-            elif letter == "J":
-                _status["jogging"] = True
-            elif letter == "M":
-                _status["motion_in_progress"] = True
-            elif letter == "P":
-                _status["in_position"] = True
-            elif letter == "S":
-                _status["stopping"] = True
-            elif letter in ("T", "W"):
-                _status["waiting"] = True
-
-        pos = send_command("get_position")
+            if letter in status_flags:
+                key, value = status_flags[letter]
+                _status[key] = value
+
         if not isinstance(pos, self.ack_flags):
             _status["position"] = pos
         elif pos == self.ack_flags.LOST_CONNECTION:
             return
 
-        alarm_status = self.retrieve_motor_alarm(
-            defer_status_update=True,
-            direct_send=direct_send,
-        )
-        if not isinstance(alarm_status, self.ack_flags):
-            _status.update(alarm_status)
-        elif alarm_status == self.ack_flags.LOST_CONNECTION:
+        if not isinstance(alarm_rtn, self.ack_flags):
+            _status.update(self._process_alarm_return(alarm_rtn))
+        elif alarm_rtn == self.ack_flags.LOST_CONNECTION:
             return
 
         if "moving" not in _status:
@@ -1557,37 +1695,63 @@ class Motor(EventActor):
         if isinstance(rtn, self.ack_flags):
             return rtn
 
-        codes = []
-        for i, digit in enumerate(rtn):
-            integer = int(digit)
-            codes.append(integer * 10**(3-i))
+        alarm_status = self._process_alarm_return(rtn)
 
-        alarm_message = []
-        for code in codes:
-            try:
-                msg = self._alarm_codes[code]
-                alarm_message.append(f"{code:04d} - {msg}")
-            except KeyError:
-                pass
+        if not defer_status_update:
+            self._update_status(**alarm_status)
 
-        alarm_message = " :: ".join(alarm_message)
+        return alarm_status
 
-        if rtn != "0000":
-            self.logger.error(f"Motor returned alarm(s): {alarm_message}")
+    def _process_alarm_return(self, rtn: str) -> Dict[str, Any]:
+        """
+        Convert the alarm code string ``rtn`` returned by the
+        ``"alarm"`` command into the alarm status, and log any
+        reported alarms.
+        """
+        alarm_status = self._decode_alarm(rtn)
+
+        if rtn.strip("0"):
+            # at least one alarm bit is set
+            self.logger.error(
+                f"Motor returned alarm(s): {alarm_status['alarm_message']}"
+            )
 
-        alarm_status = {
+        return alarm_status
+
+    @classmethod
+    def _decode_alarm(cls, rtn: str) -> Dict[str, Any]:
+        """
+        Decode the hex alarm bitfield string ``rtn`` returned by the
+        ``"alarm"`` command into the alarm status.
+
+        Examples
+        --------
+
+        >>> from bapsf_motion.actors import Motor
+        >>> Motor._decode_alarm("0006")
+        {'alarm_message': '0004 - CW limit :: 0002 - CCW limit',
+         'limits': {'CCW': True, 'CW': True}}
+        >>> Motor._decode_alarm("400A")["alarm_message"]
+        '4000 - blank Q segment :: 0008 - over temp  [Drive Fault] :: 0002 - CCW limit'
+        >>> Motor._decode_alarm("0000")
+        {'alarm_message': '', 'limits': {'CCW': False, 'CW': False}}
+        """
+        bits = int(rtn, 16)
+
+        alarm_message = " :: ".join(
+            f"{code:04X} - {msg}"
+            for code, msg in reversed(cls._alarm_codes.items())
+            if bits & code
+        )
+
+        return {
             "alarm_message": alarm_message,
             "limits": {
-                "CCW": True if 2 in codes else False,
-                "CW": True if 4 in codes else False,
+                "CCW": bool(bits & 0x0002),
+                "CW": bool(bits & 0x0004),
             },
         }
 
-        if not defer_status_update:
-            self._update_status(**alarm_status)
-
-        return alarm_status
-
     def enable(self):
         """Enable motor (i.e. restore drive current to motor)."""
         self.send_command("enable")
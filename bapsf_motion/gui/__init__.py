@@ -6,9 +6,17 @@ __all__ = [
     "cast_color_to_rgba_string",
 ]
 
-from bapsf_motion.gui.configure.configure_ import ConfigureApp
-from bapsf_motion.gui.helpers import (
-    get_qapplication,
-    get_color_scheme,
-    cast_color_to_rgba_string,
-)
+from bapsf_motion.utils import _lazy_attributes
+
+# sub-modules are imported lazily (PEP 562) so importing a lightweight
+# piece of the GUI (e.g. bapsf_motion.gui.widgets) does not import the
+# full configuration GUI
+_LAZY_ATTRIBUTES = {
+    "ConfigureApp": "configure.configure_",
+    "get_qapplication": "helpers",
+    "get_color_scheme": "helpers",
+    "cast_color_to_rgba_string": "helpers",
+}
+
+
+__getattr__, __dir__ = _lazy_attributes(__name__, _LAZY_ATTRIBUTES, globals())
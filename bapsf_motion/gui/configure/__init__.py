@@ -18,7 +18,7 @@ if __name__ == "__main__":
         "-d",
         "--defaults-file",
         help="Path to the TOML defaults file that contains pre-defined configurations.",
-        default=(pathlib.Path.cwd() / "bapsf_motion.toml").resolve(),
+        default=pathlib.Path("bapsf_motion.toml"),
         type=pathlib.Path
     )
     parser.add_argument(
@@ -30,15 +30,21 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    if args.defaults_file is not None and not args.defaults_file.exists():
-        args.defaults_file = None
-    elif args.defaults_file is not None:
-        args.defaults_file = args.defaults_file.resolve()
+    def _resolve_existing(path):
+        # a strict resolve checks for existence and resolves the path
+        # in a single pass
+        if path is None:
+            return None
 
-    if args.config_file is not None and not args.config_file.exists():
-        args.config_file = None
-    elif args.config_file is not None:
-        args.config_file = args.config_file.resolve()
+        try:
+            return path.resolve(strict=True)
+        except (OSError, RuntimeError):
+            # like Path.exists(), treat inaccessible paths as missing
+            # (RuntimeError is a symlink loop for Python < 3.13)
+            return None
+
+    args.defaults_file = _resolve_existing(args.defaults_file)
+    args.config_file = _resolve_existing(args.config_file)
 
     # app = QApplication([])
     #
@@ -8,7 +8,7 @@ import logging
 
 from abc import abstractmethod
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget, QSizePolicy
 from typing import Union
 
@@ -38,6 +38,11 @@ class _OverlayWidget(QWidget):
         self.overlay_pen = QPen(QColor(60, 60, 60))
         self.overlay_pen.setWidth(3)
 
+        # cached rendering of the background and overlay, see
+        # _background_pixmap()
+        self._bg_pixmap = None  # type: Union[QPixmap, None]
+        self._bg_pixmap_key = None
+
         self._margins = [0.01, 0.01]  # [ w_margin / width, h_margin / height]
         self._set_contents_margins(*self._margins)
 
@@ -45,16 +50,43 @@ class _OverlayWidget(QWidget):
         width = int(width_fraction * self.parent().width())
         height = int(height_fraction * self.parent().height())
 
-        self.setContentsMargins(width, height, width, height)
-
-    def paintEvent(self, event):
-        # This method is, in practice, drawing the contents of
-        # your window.
+        margins = self.contentsMargins()
+        if (margins.left(), margins.top()) == (width, height):
+            return
 
+        self.setContentsMargins(width, height, width, height)
+        self.update()
+
+    def _background_pixmap(self) -> QPixmap:
+        """
+        Return the rendered background and overlay.  The rendering is
+        cached and only redrawn when the geometry, device pixel ratio,
+        or colors change.
+        """
         # get current window size
         s = self.parent().size()
+        contents = self.contentsRect()
+        dpr = self.devicePixelRatioF()
+        key = (
+            s.width(),
+            s.height(),
+            contents.width(),
+            contents.height(),
+            dpr,
+            self.background_fill_color.rgba(),
+            self.background_pen_color.rgba(),
+            self.overlay_fill_color.rgba(),
+            self.overlay_pen.color().rgba(),
+        )
+        if self._bg_pixmap is not None and key == self._bg_pixmap_key:
+            return self._bg_pixmap
+
+        pixmap = QPixmap(s * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
         qp = QPainter()
-        qp.begin(self)
+        qp.begin(pixmap)
         qp.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         qp.setPen(self.background_pen_color)
         qp.setBrush(self.background_fill_color)
@@ -66,20 +98,33 @@ class _OverlayWidget(QWidget):
         qp.setPen(_pen)
         qp.setBrush(self.overlay_fill_color)
 
-        self.contentsRect().width()
-        ow = int((s.width() - self.contentsRect().width()) / 2)
-        oh = int((s.height() - self.contentsRect().height()) / 2)
+        ow = int((s.width() - contents.width()) / 2)
+        oh = int((s.height() - contents.height()) / 2)
         qp.drawRoundedRect(
             ow,
             oh,
-            self.contentsRect().width(),
-            self.contentsRect().height(),
+            contents.width(),
+            contents.height(),
             5,
             5,
         )
 
         qp.end()
 
+        self._bg_pixmap = pixmap
+        self._bg_pixmap_key = key
+        return pixmap
+
+    def paintEvent(self, event):
+        # This method is, in practice, drawing the contents of
+        # your window.
+        qp = QPainter()
+        qp.begin(self)
+        # only rasterize the dirty region
+        qp.setClipRegion(event.region())
+        qp.drawPixmap(0, 0, self._background_pixmap())
+        qp.end()
+
     def closeEvent(self, event):
         self.closing.emit()
         event.accept()
@@ -14,10 +14,14 @@ from pathlib import Path
 from PySide6.QtCore import (
     Qt,
     QDir,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
     Signal,
     Slot,
 )
-from PySide6.QtGui import QCloseEvent, QIcon
+from PySide6.QtGui import QCloseEvent, QFont, QIcon
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -26,7 +30,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QWidget,
     QSizePolicy,
-    QTextEdit,
+    QPlainTextEdit,
     QListWidget,
     QVBoxLayout,
     QLineEdit,
@@ -50,12 +54,47 @@ from bapsf_motion.gui.widgets import (
     StyleButton,
     VLinePlain,
 )
-from bapsf_motion.utils import toml, _deepcopy_dict
+from bapsf_motion.utils import toml, _deepcopy_dict, dict_equal
 
 
 _HERE = Path(__file__).parent
 
 
+class TOMLImportRunnerSignals(QObject):
+    finished = Signal(object, object, bool)
+
+
+class TOMLImportRunner(QRunnable):
+    """
+    Read and parse a TOML file off the GUI thread.  The parsed
+    dictionary (or the raised exception) is handed back through
+    ``signals.finished``.
+    """
+
+    def __init__(self, file_name: Path, btn_enabled: bool):
+        super().__init__()
+
+        # signals must be patterned in separate class, otherwise we can not
+        # connect the signals in our __init__ ... each runner gets its own
+        # instance so connections do not pile up across imports
+        self.signals = TOMLImportRunnerSignals()
+
+        self._file_name = file_name
+        self._btn_enabled = btn_enabled
+
+    def run(self) -> None:
+        # runs in a worker thread, do NOT touch any Qt widgets here
+        try:
+            with open(self._file_name, "rb") as f:
+                result = toml.load(f)
+        except Exception as err:  # noqa
+            # always report back, so the GUI thread restores the
+            # import button
+            result = err
+
+        self.signals.finished.emit(self._file_name, result, self._btn_enabled)
+
+
 class RunWidget(QWidget):
     def __init__(self, parent: "ConfigureGUI"):
         super().__init__(parent=parent)
@@ -67,38 +106,15 @@ class RunWidget(QWidget):
         self.done_btn = DoneButton(parent=self)
         self.quit_btn = DiscardButton("Discard && Quit", parent=self)
 
-        _btn = StyleButton("IMPORT", parent=self)
-        _btn.setFixedHeight(48)
-        _btn.setPointSize(16)
-        _btn.setEnabled(False)
-        self.import_btn = _btn
-
-        _btn = StyleButton("EXPORT", parent=self)
-        _btn.setFixedHeight(48)
-        _btn.setPointSize(16)
-        _btn.setEnabled(False)
-        self.export_btn = _btn
-
-        _btn = StyleButton("ADD", parent=self)
-        _btn.setFixedHeight(38)
-        _btn.setPointSize(16)
-        self.add_mg_btn = _btn
-
-        _btn = StyleButton("REMOVE", parent=self)
-        _btn.setFixedHeight(38)
-        _btn.setPointSize(16)
-        _btn.setEnabled(False)
-        self.remove_mg_btn = _btn
-
-        _btn = StyleButton("Edit / Control", parent=self)
-        _btn.setFixedHeight(38)
-        _btn.setPointSize(16)
-        _btn.setEnabled(False)
-        self.modify_mg_btn = _btn
+        self.import_btn = self._make_btn("IMPORT", 48, enabled=False)
+        self.export_btn = self._make_btn("EXPORT", 48, enabled=False)
+        self.add_mg_btn = self._make_btn("ADD", 38)
+        self.remove_mg_btn = self._make_btn("REMOVE", 38, enabled=False)
+        self.modify_mg_btn = self._make_btn("Edit / Control", 38, enabled=False)
 
         # Define TEXT WIDGETS
 
-        self.config_widget = QTextEdit(parent=self)
+        self.config_widget = QPlainTextEdit(parent=self)
         self.mg_list_widget = QListWidget(parent=self)
         _font = self.mg_list_widget.font()
         _font.setPointSize(14)
@@ -114,6 +130,16 @@ class RunWidget(QWidget):
 
         self._connect_signals()
 
+    def _make_btn(
+        self, text: str, height: int, point_size: int = 16, enabled: bool = True
+    ) -> StyleButton:
+        """Create a `StyleButton` with a fixed ``height``."""
+        _btn = StyleButton(text, parent=self)
+        _btn.setFixedHeight(height)
+        _btn.setPointSize(point_size)
+        _btn.setEnabled(enabled)
+        return _btn
+
     def _define_layout(self):
 
         # Create layout for banner (top header)
@@ -158,8 +184,10 @@ class RunWidget(QWidget):
             QSizePolicy.Policy.Expanding,
         )
         self.config_widget.setReadOnly(True)
-        self.config_widget.font().setPointSize(14)
-        self.config_widget.font().setFamily("Courier New")
+        self.config_widget.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        font = QFont("Courier New", 14)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.config_widget.setFont(font)
 
         layout.addWidget(label, 0, 0, 1, 2)
         layout.addWidget(self.config_widget, 1, 0, 1, 2)
@@ -253,8 +281,16 @@ class ConfigureGUI(QMainWindow):
         super().__init__()
 
         self._rm = None  # type: Union[RunManager, None]
+        self._last_toml_str = None  # type: Union[str, None]
+
+        # coalesces bursts of configChanged into a single display refresh
+        self._config_refresh_timer = QTimer(self)
+        self._config_refresh_timer.setSingleShot(True)
+        self._config_refresh_timer.setInterval(0)
         self._mg_being_modified = None  # type: Union[MotionGroup, None]
 
+        self._thread_pool = QThreadPool(parent=self)
+
         # setup logger
         self._logging_config_dict = _deepcopy_dict(gui_logger_config_dict)
         logging.config.dictConfig(self._logging_config_dict)
@@ -309,9 +345,8 @@ class ConfigureGUI(QMainWindow):
 
         self._run_widget.run_name_widget.editingFinished.connect(self.change_run_name)
 
-        self.configChanged.connect(self.update_display_config_text)
-        self.configChanged.connect(self.update_display_rm_name)
-        self.configChanged.connect(self.update_display_mg_list)
+        self.configChanged.connect(self._config_refresh_timer.start)
+        self._config_refresh_timer.timeout.connect(self._refresh_config_display)
 
     def _define_main_window(self):
         self.setWindowTitle("Run Configuration")
@@ -361,6 +396,20 @@ class ConfigureGUI(QMainWindow):
         return self._logging_config_dict
 
     def replace_rm(self, config):
+        if isinstance(self.rm, RunManager) and not self.rm.terminated:
+            try:
+                config = RunManagerConfig(config, logger=self._rm_logger)
+            except (TypeError, ValueError):
+                # let RunManager handle (and log) the bad configuration
+                pass
+            else:
+                if self._only_run_name_differs(config):
+                    # no need to tear down and rebuild the motion groups
+                    self.logger.info(f"Renaming the run to '{config['name']}'.")
+                    self.rm.config.update_run_name(config["name"])
+                    self.configChanged.emit()
+                    return
+
         if isinstance(self.rm, RunManager):
             self.rm.terminate()
 
@@ -383,6 +432,19 @@ class ConfigureGUI(QMainWindow):
         self.rm = _rm
         self.configChanged.emit()
 
+    def _only_run_name_differs(self, config: RunManagerConfig) -> bool:
+        """
+        `True` if ``config`` only differs from the current run
+        configuration by its ``name`` (and ``date``).
+        """
+        new_config = _deepcopy_dict(config)
+        old_config = _deepcopy_dict(self.rm.config)
+        for key in ("name", "date"):
+            new_config.pop(key, None)
+            old_config.pop(key, None)
+
+        return dict_equal(new_config, old_config)
+
     def save_and_close(self):
         # save the toml configuration
         # TODO: write code to save current toml configuration to a tmp file
@@ -410,41 +472,91 @@ class ConfigureGUI(QMainWindow):
 
         self.logger.info(f"Opening and reading file: {file_name} ...")
 
-        with open(file_name, "rb") as f:
-            run_config = toml.load(f)
+        # read and parse the file off the GUI thread, the result is
+        # handed back to the GUI thread via the runner's finished signal
+        btn_enabled = self._run_widget.import_btn.isEnabled()
+        self._run_widget.import_btn.setEnabled(False)
+
+        runner = TOMLImportRunner(file_name, btn_enabled)
+        runner.signals.finished.connect(self._toml_import_finish)
+        self._thread_pool.start(runner)
+
+    @Slot(object, object, bool)
+    def _toml_import_finish(self, file_name: Path, result, btn_enabled: bool):
+        self._run_widget.import_btn.setEnabled(btn_enabled)
 
-        self.replace_rm(run_config)
+        if isinstance(result, Exception):
+            self.logger.error(
+                f"Unable to read file {file_name}: "
+                f"{result.__class__.__name__}: {result}"
+            )
+            return
+
+        self.replace_rm(result)
         self._OPENED_FILE = file_name
         self.logger.info(f"... Success!")
 
+    def _refresh_config_display(self):
+        self.update_display_config_text()
+        self.update_display_rm_name()
+        self.update_display_mg_list()
+
     def update_display_config_text(self):
-        self.logger.info(f"Updating the run config toml: {self.rm.config.as_toml_string}")
-        self._run_widget.config_widget.setText(self.rm.config.as_toml_string)
+        toml_str = self.rm.config.as_toml_string
+        if toml_str == self._last_toml_str:
+            # nothing changed, skip the re-layout of the text widget
+            return
+
+        self.logger.info(f"Updating the run config toml: {toml_str}")
+        self._last_toml_str = toml_str
+        self._run_widget.config_widget.setPlainText(toml_str)
 
     def update_display_rm_name(self):
         rm_name = self.rm.config["name"]
         self._run_widget.run_name_widget.setText(rm_name)
 
     def update_display_mg_list(self):
-        self._run_widget.mg_list_widget.clear()
+        list_widget = self._run_widget.mg_list_widget
         self._run_widget.remove_mg_btn.setEnabled(False)
         self._run_widget.modify_mg_btn.setEnabled(False)
 
-        if self.rm.mgs is None or not self.rm.mgs:
-            return
-
+        entries = []
         for key, mg in self.rm.mgs.items():
             label = self._generate_mg_list_name(key, mg.config["name"])
-            self.logger.info(f"Adding to MG List - {label}")
-            _icon = (
-                qta.icon("fa5.window-close", color="red") if mg.terminated
-                else qta.icon("fa5.check-circle", color="green")
-            )  # type: QIcon
-            _item = QListWidgetItem(
-                _icon,
-                label,
-                listview=self._run_widget.mg_list_widget,
-            )
+            entries.append((label, mg.terminated))
+
+        # only update the rows that changed, instead of rebuilding the
+        # whole list
+        list_widget.setUpdatesEnabled(False)
+        try:
+            while list_widget.count() > len(entries):
+                list_widget.takeItem(list_widget.count() - 1)
+
+            for row, (label, terminated) in enumerate(entries):
+                _item = list_widget.item(row)  # type: Union[QListWidgetItem, None]
+                if (
+                    _item is not None
+                    and _item.text() == label
+                    and _item.data(Qt.ItemDataRole.UserRole) == terminated
+                ):
+                    continue
+
+                self.logger.info(f"Adding to MG List - {label}")
+                _icon = (
+                    qta.icon("fa5.window-close", color="red") if terminated
+                    else qta.icon("fa5.check-circle", color="green")
+                )  # type: QIcon
+                if _item is None:
+                    _item = QListWidgetItem(_icon, label, listview=list_widget)
+                else:
+                    _item.setText(label)
+                    _item.setIcon(_icon)
+                _item.setData(Qt.ItemDataRole.UserRole, terminated)
+
+            # no motion group is selected after an update
+            list_widget.setCurrentRow(-1)
+        finally:
+            list_widget.setUpdatesEnabled(True)
 
     def change_run_name(self):
         name = self._run_widget.run_name_widget.text()
@@ -585,6 +697,8 @@ class ConfigureGUI(QMainWindow):
         self.logger.info("Closing ConfigureGUI")
 
         self.configChanged.disconnect()
+        # a pending refresh would read self.rm after it is torn down
+        self._config_refresh_timer.stop()
 
         if isinstance(self.rm, RunManager) and not self.rm.terminated:
             self.rm.terminate()
@@ -595,6 +709,9 @@ class ConfigureGUI(QMainWindow):
 
         self._run_widget.close()
 
+        self._thread_pool.clear()
+        self._thread_pool.waitForDone(200)
+
         event.accept()
 
 
@@ -27,7 +27,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QSizePolicy,
-    QTextEdit,
+    QPlainTextEdit,
     QVBoxLayout,
     QWidget,
     QStackedWidget,
@@ -1685,14 +1685,16 @@ class MGWidget(QWidget):
 
         # Define TEXT WIDGETS
 
-        _widget = QTextEdit(parent=self)
+        _widget = QPlainTextEdit(parent=self)
         _widget.setSizePolicy(
             QSizePolicy.Policy.Preferred,
             QSizePolicy.Policy.Expanding,
         )
         _widget.setReadOnly(True)
-        _widget.font().setPointSize(14)
-        _widget.font().setFamily("Courier New")
+        _widget.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        font = QFont("Courier New", 14)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        _widget.setFont(font)
         _widget.setMinimumWidth(350)
         self.toml_widget = _widget
 
@@ -2667,7 +2669,7 @@ class MGWidget(QWidget):
         self._populate_transform_dropdown()
 
     def _update_toml_widget(self):
-        self.toml_widget.setText(toml.as_toml_string(self.mg_config))
+        self.toml_widget.setPlainText(toml.as_toml_string(self.mg_config))
 
     def _update_mg_name_widget(self):
         self.mg_name_widget.setText(self.mg_config["name"])
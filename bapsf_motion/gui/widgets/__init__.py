@@ -24,25 +24,31 @@ __all__ = [
     "ZeroButton",
 ]
 
-from bapsf_motion.gui.widgets.logging import QLogHandler, QLogger
-from bapsf_motion.gui.widgets.buttons import (
-    BannerButton,
-    DiscardButton,
-    DoneButton,
-    GearButton,
-    GearValidButton,
-    IconButton,
-    LED,
-    StopButton,
-    StyleButton,
-    ValidButton,
-    ZeroButton,
-)
-from bapsf_motion.gui.widgets.misc import (
-    BatteryStatusIcon,
-    IPv4Validator,
-    QLineEditSpecialized,
-    QTAIconLabel,
-    HLinePlain,
-    VLinePlain,
-)
+from bapsf_motion.utils import _lazy_attributes
+
+# widgets are imported lazily (PEP 562) so only the widget modules that
+# are actually used get imported
+_WIDGET_MODULES = {
+    "BannerButton": "buttons",
+    "BatteryStatusIcon": "misc",
+    "DiscardButton": "buttons",
+    "DoneButton": "buttons",
+    "GearButton": "buttons",
+    "GearValidButton": "buttons",
+    "HLinePlain": "misc",
+    "IconButton": "buttons",
+    "IPv4Validator": "misc",
+    "LED": "buttons",
+    "QLineEditSpecialized": "misc",
+    "QLogger": "logging",
+    "QLogHandler": "logging",
+    "QTAIconLabel": "misc",
+    "StopButton": "buttons",
+    "StyleButton": "buttons",
+    "ValidButton": "buttons",
+    "VLinePlain": "misc",
+    "ZeroButton": "buttons",
+}
+
+
+__getattr__, __dir__ = _lazy_attributes(__name__, _WIDGET_MODULES, globals())
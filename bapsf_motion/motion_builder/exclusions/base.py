@@ -7,9 +7,57 @@ import re
 import xarray as xr
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 from bapsf_motion.motion_builder.item import MBItem
+from bapsf_motion.utils.numba_ import HAS_NUMBA, njit, prange
+
+#: Number of points above which the `numba` compiled kernel is used for
+#: the lookups of 2D exclusions in `BaseExclusion.is_excluded_many`.
+#: Below this the call overhead outweighs the savings over `numpy`.
+_NUMBA_LOOKUP_THRESHOLD = 10_000
+
+
+def _nearest_indices(coord: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Return the indices of the entries in the strictly increasing 1D
+    array ``coord`` that are nearest to ``values``.  This matches the
+    ``method="nearest"`` selection of `xarray` (`pandas`), i.e. ties
+    resolve to the larger coordinate and values outside ``coord``
+    resolve to the closest end.
+    """
+    if coord.size == 1:
+        return np.zeros(values.shape, dtype=np.intp)
+
+    right = np.clip(np.searchsorted(coord, values), 1, coord.size - 1)
+    left = right - 1
+    return np.where(values - coord[left] < coord[right] - values, left, right)
+
+
+@njit(cache=True)
+def _nearest_index(coord, value):
+    """Scalar version of `_nearest_indices` for the `numba` kernels."""
+    if coord.size == 1:
+        return 0
+
+    right = min(max(np.searchsorted(coord, value), 1), coord.size - 1)
+    left = right - 1
+    return left if value - coord[left] < coord[right] - value else right
+
+
+@njit(cache=True, parallel=True)
+def _fill_excluded_2d(points, axes, coord0, coord1, values, out):
+    """
+    Fill ``out`` (shape ``(M, )``) with `True` where the nearest entry
+    of the 2D exclusion array ``values`` to ``points`` (shape
+    ``(M, N)``) is `False`.  ``coord0`` and ``coord1`` are the
+    coordinates of the two axes of ``values``, and ``axes`` gives the
+    column of ``points`` corresponding to each.
+    """
+    for ii in prange(points.shape[0]):
+        i0 = _nearest_index(coord0, points[ii, axes[0]])
+        i1 = _nearest_index(coord1, points[ii, axes[1]])
+        out[ii] = not values[i0, i1]
 
 
 class BaseExclusion(MBItem):
@@ -48,6 +96,14 @@ class BaseExclusion(MBItem):
         self._inputs = kwargs
         self.skip_ds_add = skip_ds_add
 
+        # the exclusion DataArray last fetched from the Dataset, see
+        # the exclusion property
+        self._cached_item = None  # type: Union[xr.DataArray, None]
+
+        # raw arrays for the nearest neighbor lookups of is_excluded(),
+        # see _exclusion_lookup()
+        self._lookup = None  # type: Union[Tuple, None]
+
         self.composed_exclusions = {}  # type: Dict[str, BaseExclusion]
         """
         Dictionary of dependent :term:`motion exclusions` used to make
@@ -120,11 +176,19 @@ class BaseExclusion(MBItem):
         if self.skip_ds_add:
             return self._stored_exclusion
 
-        try:
-            return self.item
-        except KeyError:
+        variable = self._ds.variables.get(self.name, None)
+        if variable is None:
             self.regenerate_exclusion()
-            return self.item
+            variable = self._ds.variables[self.name]
+
+        # Fetching the DataArray from the Dataset is considerably more
+        # expensive than the variable lookup, so only re-fetch when the
+        # underlying variable has been replaced.
+        item = self._cached_item
+        if item is None or item.variable is not variable:
+            item = self._cached_item = self.item
+
+        return item
 
     @property
     def inputs(self) -> Dict[str, Any]:
@@ -171,6 +235,48 @@ class BaseExclusion(MBItem):
 
         return f"{self.base_name}{_id:d}"
 
+    def _exclusion_lookup(self) -> Tuple:
+        """
+        Return a tuple ``(exclusion, mspace_dims, values, coords, axes)``
+        for the nearest neighbor lookups of :meth:`is_excluded_many`.
+        ``mspace_dims`` is :attr:`mspace_dims` as a `tuple`, ``values``
+        is the raw `~numpy.ndarray` of :attr:`exclusion`,
+        and for each dimension of :attr:`exclusion` ``coords`` contains
+        its coordinate array and ``axes`` the index of that dimension
+        in :attr:`mspace_dims`.  ``coords`` is `None` if the
+        coordinates can not be searched directly, in which case the
+        lookup falls back to `xarray`.
+        """
+        exclusion = self.exclusion
+        lookup = self._lookup
+        if lookup is not None and lookup[0] is exclusion:
+            return lookup
+
+        mspace_dims = tuple(self.mspace_dims)
+        coords = []
+        axes = []
+        for dim in exclusion.dims:
+            if dim not in mspace_dims or dim not in exclusion.coords:
+                coords = None
+                break
+
+            coord = np.asarray(exclusion.coords[dim].values)
+            if coord.dtype.kind not in "iuf" or np.any(np.diff(coord) <= 0):
+                coords = None
+                break
+
+            coords.append(coord)
+            axes.append(mspace_dims.index(dim))
+
+        lookup = self._lookup = (
+            exclusion,
+            mspace_dims,
+            np.asarray(exclusion.values),
+            None if coords is None else tuple(coords),
+            tuple(axes),
+        )
+        return lookup
+
     def is_excluded(self, point):
         """
         Check if ``point`` resides in an excluded region defined by
@@ -187,16 +293,150 @@ class BaseExclusion(MBItem):
         bool
             `True` if the point resides in an excluded region defined
             by this :term:`motion exclusion`, otherwise `False`.
+
+        Examples
+        --------
+
+        >>> from bapsf_motion.motion_builder import MotionBuilder
+        >>> mb = MotionBuilder(
+        ...     space=[
+        ...         {"label": "x", "range": [-10, 10], "num": 21},
+        ...         {"label": "y", "range": [-10, 10], "num": 21},
+        ...     ],
+        ...     exclusions=[
+        ...         {
+        ...             "type": "circle",
+        ...             "radius": 5,
+        ...             "center": [0, 0],
+        ...             "exclude": "inside",
+        ...         },
+        ...     ],
+        ... )
+        >>> ex = mb.exclusions[0]
+        >>> ex.is_excluded([0, 0]), ex.is_excluded([8, 8])
+        (True, False)
+        >>> ex.is_excluded([0, 0, 0])
+        Traceback (most recent call last):
+        ...
+        ValueError
         """
         # True if the point is excluded, False if the point is included
-        if len(point) != self.mspace_ndims:
+        lookup = self._exclusion_lookup()
+        if len(point) != len(lookup[1]):
             raise ValueError
 
-        select = {}
-        for ii, dim_name in enumerate(self.mspace_dims):
-            select[dim_name] = point[ii]
+        points = np.asarray(point)[np.newaxis, ...]
+        return bool(self._is_excluded_many(points, lookup)[0])
+
+    def is_excluded_many(self, points) -> np.ndarray:
+        """
+        Check which of ``points`` reside in an excluded region defined
+        by this :term:`motion exclusion`.
+
+        Parameters
+        ----------
+        points: :term:`array_like`
+            An :term:`array_like` variable of shape ``(M, N)``, where
+            ``N`` is equal to :attr:`mspace_ndims`.
+
+        Returns
+        -------
+        `~numpy.ndarray`
+            Boolean array of shape ``(M, )`` that is `True` where the
+            point resides in an excluded region defined by this
+            :term:`motion exclusion`, and `False` otherwise.
+
+        Examples
+        --------
+
+        >>> import numpy as np
+        >>> from bapsf_motion.motion_builder import MotionBuilder
+        >>> mb = MotionBuilder(
+        ...     space=[
+        ...         {"label": "x", "range": [-10, 10], "num": 21},
+        ...         {"label": "y", "range": [-10, 10], "num": 21},
+        ...     ],
+        ...     exclusions=[
+        ...         {
+        ...             "type": "circle",
+        ...             "radius": 5,
+        ...             "center": [0, 0],
+        ...             "exclude": "inside",
+        ...         },
+        ...     ],
+        ... )
+        >>> ex = mb.exclusions[0]
+        >>> ex.is_excluded_many([[0, 0], [8, 8]])
+        array([ True, False])
+
+        The result matches :meth:`is_excluded` point-by-point, for
+        both small and large (compiled lookup) point sets.
+
+        >>> rng = np.random.default_rng(0)
+        >>> for npoints in (100, 20_000):
+        ...     points = rng.uniform(-10, 10, size=(npoints, 2))
+        ...     expected = [ex.is_excluded(point) for point in points]
+        ...     print(np.array_equal(ex.is_excluded_many(points), expected))
+        True
+        True
+
+        ``points`` must be a 2D array of ``mspace_ndims`` columns.
+
+        >>> ex.is_excluded_many([0, 0])
+        Traceback (most recent call last):
+        ...
+        ValueError: Expected an array of points with shape (M, 2), got shape (2,).
+        """
+        lookup = self._exclusion_lookup()
+        mspace_ndims = len(lookup[1])
+
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != mspace_ndims:
+            raise ValueError(
+                f"Expected an array of points with shape (M, {mspace_ndims}),"
+                f" got shape {points.shape}."
+            )
 
-        return not bool(self.exclusion.sel(method="nearest", **select).data)
+        return self._is_excluded_many(points, lookup)
+
+    @staticmethod
+    def _is_excluded_many(points: np.ndarray, lookup: Tuple) -> np.ndarray:
+        """
+        The lookup behind :meth:`is_excluded_many` for an already
+        validated ``points`` array and the tuple ``lookup`` returned by
+        :meth:`_exclusion_lookup`.
+        """
+        exclusion, mspace_dims, values, coords, axes = lookup
+
+        if coords is None:
+            select = {}
+            for ii, dim_name in enumerate(mspace_dims):
+                select[dim_name] = xr.DataArray(points[:, ii], dims="point")
+
+            included = exclusion.sel(method="nearest", **select).data
+            return np.logical_not(included.astype(bool, copy=False))
+
+        if (
+            HAS_NUMBA
+            and len(coords) == 2
+            and points.shape[0] > _NUMBA_LOOKUP_THRESHOLD
+        ):
+            excluded = np.empty(points.shape[0], dtype=bool)
+            _fill_excluded_2d(
+                np.ascontiguousarray(points, dtype=np.float64),
+                np.array(axes, dtype=np.intp),
+                coords[0],
+                coords[1],
+                values,
+                excluded,
+            )
+            return excluded
+
+        index = tuple(
+            _nearest_indices(coord, points[:, axis])
+            for coord, axis in zip(coords, axes)
+        )
+        return np.logical_not(values[index])
 
     def regenerate_exclusion(self):
         """
@@ -213,6 +453,7 @@ class BaseExclusion(MBItem):
         self.composed_exclusions.clear()
 
         self._ds[self.name] = self._generate_exclusion()
+        self._cached_item = None
 
     def update_global_mask(self):
         """
@@ -225,7 +466,25 @@ class BaseExclusion(MBItem):
                 f"the exclusion can not be merged into the global maks."
             )
 
-        self.mask[...] = np.logical_and(self.mask, self.exclusion)
+        mask = self.mask
+        exclusion = self.exclusion
+        if exclusion.dims != mask.dims and set(exclusion.dims) == set(mask.dims):
+            # transposing only creates a view
+            exclusion = exclusion.transpose(*mask.dims)
+
+        if exclusion.dims != mask.dims:
+            # let xarray align the dimensions
+            mask[...] = np.logical_and(mask, exclusion)
+            return
+
+        ex_values = exclusion.values
+        if ex_values.all():
+            # nothing is excluded
+            return
+
+        # combine in-place, writing directly into the mask's buffer
+        mask_values = mask.values
+        np.logical_and(mask_values, ex_values, out=mask_values)
 
 
 class GovernExclusion(BaseExclusion, ABC):
@@ -4,11 +4,12 @@ Module that defines the `LaPDXYExclusion` class.
 __all__ = ["LaPDXYExclusion"]
 __mexclusions__ = ["LaPDXYExclusion"]
 
+import math
 import numpy as np
 import xarray as xr
 
 from numbers import Real
-from typing import Tuple, Union
+from typing import Hashable, Tuple, Union
 
 from bapsf_motion.motion_builder.exclusions.base import GovernExclusion
 from bapsf_motion.motion_builder.exclusions.circular import CircularExclusion
@@ -139,6 +140,31 @@ class LaPDXYExclusion(GovernExclusion):
               "port_location": "W",
               "cone_full_angle": 60,
           }
+
+    The ``cone_full_angle`` must be strictly between 0 and 180
+    degrees.
+
+    >>> from bapsf_motion.motion_builder import MotionBuilder
+    >>> space = [
+    ...     {"label": "x", "range": [-55, 55], "num": 111},
+    ...     {"label": "y", "range": [-55, 55], "num": 111},
+    ... ]
+    >>> mb = MotionBuilder(
+    ...     space=space,
+    ...     exclusions=[{"type": "lapd_xy", "cone_full_angle": 60}],
+    ... )
+    >>> mb.exclusions[0].cone_full_angle
+    60
+    >>> for angle in (0, 180):
+    ...     try:
+    ...         MotionBuilder(
+    ...             space=space,
+    ...             exclusions=[{"type": "lapd_xy", "cone_full_angle": angle}],
+    ...         )
+    ...     except ValueError as err:
+    ...         print(err)
+    The cone full angle is 0, expected a value between (0, 180) degrees.
+    The cone full angle is 180, expected a value between (0, 180) degrees.
     """
     _exclusion_type = "lapd_xy"
     _dimensionality = 2
@@ -238,18 +264,19 @@ class LaPDXYExclusion(GovernExclusion):
 
         if not isinstance(self.cone_full_angle, (float, int)):
             raise ValueError
-        elif 0 <= self.cone_full_angle >= 180:
-            raise ValueError
+        elif not (0 < self.cone_full_angle < 180):
+            raise ValueError(
+                f"The cone full angle is {self.cone_full_angle}, expected a "
+                f"value between (0, 180) degrees."
+            )
 
         if isinstance(self.port_location, str):
-            if self.port_location.casefold() not in map(
-                str.casefold, self._port_location_to_angle
-            ):
+            # keys of _port_location_to_angle are already casefolded
+            port_location = self.port_location.casefold()
+            if port_location not in self._port_location_to_angle:
                 raise ValueError
 
-            self.inputs["port_location"] = (
-                self._port_location_to_angle[self.port_location.lower()]
-            )
+            self.inputs["port_location"] = self._port_location_to_angle[port_location]
 
         if not isinstance(self.port_location, (float, int)):
             raise TypeError
@@ -260,30 +287,64 @@ class LaPDXYExclusion(GovernExclusion):
             )
 
         # populate additional attributes
+        theta = math.radians(self.port_location)
         self._insertion_point = np.array(
             [
-                self.pivot_radius * np.cos(np.deg2rad(self.port_location)),
-                self.pivot_radius * np.sin(np.deg2rad(self.port_location)),
+                self.pivot_radius * math.cos(theta),
+                self.pivot_radius * math.sin(theta),
             ],
         )
 
+    @staticmethod
+    def _aligned_values(
+        exclusion: xr.DataArray, dims: Tuple[Hashable, ...]
+    ) -> Union[np.ndarray, None]:
+        """
+        Return the raw `~numpy.ndarray` of ``exclusion`` with its axes
+        ordered like ``dims``, or `None` if ``exclusion`` does not have
+        exactly the dimensions ``dims``.
+        """
+        if exclusion.dims == dims:
+            return exclusion.values
+        elif set(exclusion.dims) != set(dims) or len(exclusion.dims) != len(dims):
+            return None
+
+        # transposing only creates a view
+        return np.transpose(
+            exclusion.values, [exclusion.dims.index(dim) for dim in dims]
+        )
+
     def _combine_exclusions(self):
         """Combine all sub-exclusions into one exclusion array."""
-        ex1 = self.composed_exclusions["chamber"]
-        try:
-            ex2 = self.composed_exclusions["port"]
-            exclusion = np.logical_or(ex1.exclusion, ex2.exclusion)
-        except KeyError:
-            exclusion = ex1.exclusion
-            pass
+        # The sub-exclusions share the coordinates of the motion space,
+        # so they are combined as raw arrays.  xarray's per-operation
+        # alignment costs ~100x more than these boolean operations and
+        # is only used when the dimensions can not be matched up.
+        chamber = self.composed_exclusions["chamber"].exclusion
+        port = self.composed_exclusions["port"].exclusion
+
+        port_values = self._aligned_values(port, chamber.dims)
+        if port_values is None:
+            exclusion = np.logical_or(chamber, port)
+        else:
+            exclusion = chamber.copy(
+                data=np.logical_or(chamber.values, port_values)
+            )
 
+        # exclusion is a new array, so the remaining sub-exclusions can
+        # be combined in-place
+        values = exclusion.values
         for ex_name, ex in self.composed_exclusions.items():
             if ex_name in {"chamber", "port"}:
                 continue
-            exclusion = np.logical_and(
-                exclusion,
-                ex.exclusion,
-            )
+
+            ex_values = self._aligned_values(ex.exclusion, exclusion.dims)
+            if ex_values is None:
+                exclusion = np.logical_and(exclusion, ex.exclusion)
+                values = exclusion.values
+                continue
+
+            np.logical_and(values, ex_values, out=values)
 
         return exclusion
 
@@ -292,15 +353,19 @@ class LaPDXYExclusion(GovernExclusion):
         Generate and return the boolean mask corresponding to the
         exclusion configuration.
         """
+        if not self.include_cone:
+            # without a port there is no pivot to cast a shadow or
+            # define a cone, the chamber wall is the only constraint
+            ex = self._generate_chamber_exclusion()
+            self.composed_exclusions["chamber"] = ex
+            return ex.exclusion
+
         ex = self._generate_shadow_exclusion()
         self.composed_exclusions["shadow"] = ex
 
         ex = self._generate_chamber_exclusion()
         self.composed_exclusions["chamber"] = ex
 
-        if not self.include_cone:
-            return self._combine_exclusions()
-
         ex = self._generate_port_exclusion()
         self.composed_exclusions["port"] = ex
 
@@ -323,15 +388,19 @@ class LaPDXYExclusion(GovernExclusion):
         # determine slope for code exclusion
         # - P is considered a point in the LaPD coordinate system
         # - P' is considered a point in the pivot (port) coordinate system
-        theta = np.radians(self.port_location)
-        alpha = 0.5 * np.radians(self.cone_full_angle)
+        # (scalar trig is done with math, it is much cheaper than
+        # dispatching numpy ufuncs on scalars)
+        theta = math.radians(self.port_location)
+        alpha = math.radians(0.5 * self.cone_full_angle)
+        cos_theta, sin_theta = math.cos(theta), math.sin(theta)
+        cos_alpha, sin_alpha = math.cos(alpha), math.sin(alpha)
         pivot_xy = self.insertion_point
 
         # rotation matrix to go P -> P'
         rot_matrix = np.array(
             [
-                [np.cos(theta), -np.sin(theta)],
-                [np.sin(theta), np.cos(theta)],
+                [cos_theta, -sin_theta],
+                [sin_theta, cos_theta],
             ],
         )
 
@@ -339,29 +408,35 @@ class LaPDXYExclusion(GovernExclusion):
         inv_rot_matrix = np.linalg.inv(rot_matrix)
 
         # unit vectors representing the cone trajectories in P'
-        cone_trajectories = {
-            "upper": np.array([-np.cos(alpha), np.sin(alpha)]),
-            "lower": np.array([-np.cos(alpha), -np.sin(alpha)]),
-        }
+        # (rows are the "upper" and "lower" trajectories)
+        cone_trajectories = np.array(
+            [
+                [-cos_alpha, sin_alpha],
+                [-cos_alpha, -sin_alpha],
+            ],
+        )
 
-        # unit vectors representing the cone trajectories in P
-        exclusions = {}
-        for key, traj in cone_trajectories.items():
-            p_traj = np.matmul(traj, inv_rot_matrix)
+        # unit vectors pointing into the excluded region of each
+        # trajectory in P'
+        exc_dirs = np.array([[0.0, 1.0], [0.0, -1.0]])
 
-            slope = p_traj[1] / p_traj[0]
-            intercept = pivot_xy[1] - slope * pivot_xy[0]
+        # rotate both sets of vectors into P
+        p_trajs = np.matmul(cone_trajectories, inv_rot_matrix)
+        exc_dirs = np.matmul(exc_dirs, inv_rot_matrix)
 
-            sign = 1.0 if key == "upper" else -1.0
-            exc_dir = np.matmul(np.array([0.0, sign * 1.0]), inv_rot_matrix)
+        slopes = p_trajs[:, 1] / p_trajs[:, 0]
+        intercepts = pivot_xy[1] - slopes * pivot_xy[0]
+        axes = np.where(np.abs(exc_dirs[:, 0]) > np.abs(exc_dirs[:, 1]), 0, 1)
 
-            axis = 0 if np.abs(exc_dir[0]) > np.abs(exc_dir[1]) else 1
-            exclude = f"+e{axis}" if exc_dir[axis] > 0 else f"-e{axis}"
+        exclusions = {}
+        for ii, key in enumerate(("upper", "lower")):
+            axis = axes[ii]
+            exclude = f"+e{axis}" if exc_dirs[ii, axis] > 0 else f"-e{axis}"
 
             ex = DividerExclusion(
                 self._ds,
                 skip_ds_add=True,
-                mb=(slope, intercept),
+                mb=(slopes[ii], intercepts[ii]),
                 exclude=exclude,
             )
             exclusions[f"divider_{key}"] = ex
@@ -370,8 +445,8 @@ class LaPDXYExclusion(GovernExclusion):
 
     def _generate_port_exclusion(self):
         # divider representing the port opening
-        theta = np.radians(self.port_location)
-        alpha = 0.5 * np.radians(self.cone_full_angle)
+        theta = math.radians(self.port_location)
+        alpha = math.radians(0.5 * self.cone_full_angle)
         pivot_xy = self.insertion_point
 
         radius = 0.5 * self.diameter
@@ -177,16 +177,30 @@ class BaseLayer(MBItem):
         if isinstance(points, xr.DataArray):
             return points
 
+        return xr.DataArray(data=points, dims=self._point_matrix_dims(points))
+
+    def _point_matrix_dims(self, points: np.ndarray) -> List[str]:
+        """
+        Determine the dimension names for the :term:`motion layer`
+        array/matrix ``points``.
+        """
         if self.name in self._ds.data_vars:
-            dims = self._ds[self.name].dims
-        else:
-            dims = [f"{self.name}_d{ii}" for ii in range(points.ndim - 1)]
-            dims.append("space")
+            return list(self._ds[self.name].dims)
 
-        return xr.DataArray(data=points, dims=dims)
+        dims = [f"{self.name}_d{ii}" for ii in range(points.ndim - 1)]
+        dims.append("space")
+        return dims
 
     def regenerate_point_matrix(self):
         """
         Re-generated the :term:`motion layer`, i.e. :attr:`points`.
         """
-        self._ds[self.name] = self._generate_point_matrix_da()
+        points = self._generate_point_matrix()
+
+        if isinstance(points, xr.DataArray):
+            self._ds[self.name] = points
+            return
+
+        # hand the numpy array directly to the Dataset, this avoids
+        # building an intermediate DataArray
+        self._ds[self.name] = (self._point_matrix_dims(points), points)
@@ -6,12 +6,167 @@ __mlayers__ = ["GridLayer", "GridCNStepLayer", "GridCNSizeLayer"]
 
 import numpy as np
 import warnings
-import xarray as xr
 
-from typing import List
+from typing import List, Tuple
 
 from bapsf_motion.motion_builder.layers.base import BaseLayer
 from bapsf_motion.motion_builder.layers.helpers import register_layer
+from bapsf_motion.utils.numba_ import HAS_NUMBA, njit
+
+if False:
+    # noqa
+    # for annotation, does not need real import
+    from xarray import Dataset
+
+#: Minimum number of elements in a point matrix (of a >3D motion space)
+#: before the `numba` compiled fill kernel is used.
+_NUMBA_FILL_THRESHOLD = 1_000_000
+
+
+@njit(cache=True)
+def _fill_grid(layer, ax_pts, ax_offsets, npoints):
+    """
+    Fill the flattened point matrix ``layer`` (shape ``(M, N)``) in a
+    single pass, writing all ``N`` coordinates of a grid point before
+    moving to the next.  ``ax_pts`` is the concatenation of the 1D
+    axis arrays, and ``ax_offsets`` gives the starting index of each
+    axis in ``ax_pts``.
+    """
+    ndims = npoints.size
+    index = np.zeros(ndims, dtype=np.int64)
+    for ii in range(layer.shape[0]):
+        for jj in range(ndims):
+            layer[ii, jj] = ax_pts[ax_offsets[jj] + index[jj]]
+
+        # advance the grid index, last axis varies fastest
+        jj = ndims - 1
+        while jj >= 0:
+            index[jj] += 1
+            if index[jj] < npoints[jj]:
+                break
+            index[jj] = 0
+            jj -= 1
+
+
+def _grid_axis(start: float, stop: float, num: int, dtype=np.float64) -> np.ndarray:
+    """
+    Generate the 1D array of ``num`` grid coordinates inclusively
+    spanning ``start`` to ``stop``.
+    """
+    if start == stop or num == 1:
+        # assume fixed along this axis
+        return np.full(1, start, dtype=dtype)
+
+    step = (stop - start) / (num - 1)
+    if float(start).is_integer() and float(step).is_integer():
+        # integer-spaced grids are exactly representable, so the
+        # endpoint correction done by linspace is not needed
+        return np.arange(num, dtype=dtype) * step + start
+
+    return np.linspace(start, stop, num=num, dtype=dtype)
+
+
+def _grid_axes(
+    limits: np.ndarray, npoints: np.ndarray, dtype=np.float64
+) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Generate the 1D arrays of grid coordinates for all axes defined by
+    ``limits`` and ``npoints``, along with an array of the actual
+    number of points along each axis.
+    """
+    ndims = limits.shape[0]
+
+    axs = [None] * ndims  # type: List[np.ndarray]
+    _npoints = np.empty(ndims, dtype=np.int64)
+    for ii in range(ndims):
+        axs[ii] = _grid_axis(limits[ii, 0], limits[ii, 1], npoints[ii], dtype=dtype)
+        _npoints[ii] = axs[ii].size
+
+    return axs, _npoints
+
+
+def _broadcastable_axis(ax_pts: np.ndarray, index: int, ndims: int) -> np.ndarray:
+    """
+    Reshape the 1D axis array ``ax_pts`` to ``(1, ..., num, ..., 1)``
+    so it broadcasts across the grid without building a full meshgrid.
+    """
+    shape = [1] * ndims
+    shape[index] = ax_pts.size
+    return ax_pts.reshape(shape)
+
+
+def _grid_points(
+    limits: np.ndarray, npoints: np.ndarray, dtype=np.float64
+) -> np.ndarray:
+    """
+    Generate the point matrix of a regular grid.  This is the stateless
+    numeric core of `GridLayer`.
+
+    Parameters
+    ----------
+    limits: `~numpy.ndarray`
+        Validated ``(N, 2)`` array of inclusive (min, max) pairs.
+
+    npoints: `~numpy.ndarray`
+        Validated ``(N, )`` array of the number of points along each
+        axis.
+
+    dtype: `~numpy.dtype`
+        The `~numpy.dtype` of the returned point matrix.
+
+    Returns
+    -------
+    `~numpy.ndarray`
+        Array of shape ``(n_1, ..., n_N, N)``.
+
+    Examples
+    --------
+
+    The point matrix matches the `numpy.meshgrid` of the grid axes,
+    for both a small grid (broadcast fill) and a large high
+    dimensional grid (compiled fill).
+
+    >>> import numpy as np
+    >>> for num in (5, 25):
+    ...     limits = np.array([[-1.0, 1.0], [0.0, 2.0], [-3.0, 3.0], [0.0, 4.0]])
+    ...     npoints = np.array([num, num, num, num])
+    ...     axs = [np.linspace(*lims, num=num) for lims in limits]
+    ...     expected = np.stack(np.meshgrid(*axs, indexing="ij"), axis=-1)
+    ...     print(np.array_equal(_grid_points(limits, npoints), expected))
+    True
+    True
+    """
+    ndims = limits.shape[0]
+
+    if ndims == 1:
+        return _grid_axis(limits[0, 0], limits[0, 1], npoints[0], dtype=dtype)[
+            ..., np.newaxis
+        ]
+    elif ndims == 2:
+        # the motion space is most often 2D, so skip the generic
+        # broadcasting machinery
+        x = _grid_axis(limits[0, 0], limits[0, 1], npoints[0], dtype=dtype)
+        y = _grid_axis(limits[1, 0], limits[1, 1], npoints[1], dtype=dtype)
+
+        layer = np.empty((x.size, y.size, 2), dtype=dtype)
+        layer[..., 0] = x[..., np.newaxis]
+        layer[..., 1] = y[np.newaxis, ...]
+        return layer
+
+    axs, _npoints = _grid_axes(limits, npoints, dtype=dtype)
+
+    layer = np.empty(tuple(_npoints.tolist()) + (ndims,), dtype=dtype)
+    if HAS_NUMBA and ndims > 3 and layer.size > _NUMBA_FILL_THRESHOLD:
+        # large high dimensional grids are filled in one pass
+        # instead of ndims strided passes
+        offsets = np.zeros(ndims, dtype=np.int64)
+        offsets[1:] = np.cumsum(_npoints[:-1])
+        _fill_grid(layer.reshape(-1, ndims), np.concatenate(axs), offsets, _npoints)
+    else:
+        for ii, ax_pts in enumerate(axs):
+            layer[..., ii] = _broadcastable_axis(ax_pts, ii, ndims)
+
+    return layer
 
 
 @register_layer
@@ -51,6 +206,13 @@ class GridLayer(BaseLayer):
         `~xarray.Dataset`.  This keyword is provided to facilitate
         functionality of composite layers.  (DEFAULT: `False`)
 
+    dtype: `~numpy.dtype`
+        The floating point `~numpy.dtype` of the generated point
+        matrix.  A lower precision type (e.g. `numpy.float32`) halves
+        the memory footprint of large grids.  This is a runtime option
+        and is not included in the layer :attr:`config`.
+        (DEFAULT: `numpy.float64`)
+
     Examples
     --------
 
@@ -104,10 +266,11 @@ class GridLayer(BaseLayer):
 
     def __init__(
             self,
-            ds: xr.Dataset,
+            ds: "Dataset",
             limits: List[List[float]],
             npoints: List[int] = None,
             skip_ds_add: bool = False,
+            dtype: np.dtype = np.float64,
             **kwargs,
     ):
         if npoints is None and "steps" in kwargs.keys():
@@ -124,6 +287,8 @@ class GridLayer(BaseLayer):
             )
 
         # assign all, and only, instance variables above the super
+        self._dtype = self._validate_dtype(dtype)
+
         super().__init__(ds, limits=limits, npoints=npoints, skip_ds_add=skip_ds_add)
 
     def _generate_point_matrix(self):
@@ -131,44 +296,58 @@ class GridLayer(BaseLayer):
         Generate and return a matrix of points associated with the
         :term:`motion layer`.
         """
-        axs = []
-        npoints = []
-        for lims, num in zip(self.limits, self.npoints):
-            if lims[0] == lims[1]:
-                # assume fixed along this axis
-                num = 1
-
-            axs.append(
-                np.linspace(lims[0], lims[1], num=num)
-            )
-            npoints.append(num)
-
-        pts = np.meshgrid(*axs, indexing="ij")
-        layer = np.empty(tuple(npoints) + (self.mspace_ndims,))
-        for ii, ax_pts in enumerate(pts):
-            layer[..., ii] = ax_pts
+        layer = _grid_points(self.limits, self.npoints, dtype=self.dtype)
 
         # return xr.DataArray(layer)
         return layer
 
+    @staticmethod
+    def _validate_dtype(dtype) -> np.dtype:
+        """
+        Validate the ``dtype`` argument.
+
+        Examples
+        --------
+
+        >>> import numpy as np
+        >>> dtype = GridLayer._validate_dtype(np.float32)
+        >>> _grid_points(
+        ...     np.array([[0.0, 1.0], [0.0, 2.0], [0.0, 3.0]]),
+        ...     np.array([2, 3, 4]),
+        ...     dtype=dtype,
+        ... ).dtype
+        dtype('float32')
+        >>> GridLayer._validate_dtype(np.int32)
+        Traceback (most recent call last):
+        ...
+        ValueError: Keyword 'dtype' has dtype int32, but expected a floating point dtype.
+        """
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(
+                f"Keyword 'dtype' has dtype {dtype}, but expected a "
+                f"floating point dtype."
+            )
+
+        return dtype
+
     def _validate_inputs(self):
         """
         Validate the input arguments passed during instantiation.
         These inputs are stored in :attr:`inputs`.
         """
         limits = self._validate_limits(self.limits)
-        self._set_limits(limits)
-
         npoints = self._validate_npoints(self.npoints)
-        self._set_npoints(npoints)
+
+        self._set_inputs(limits=limits, npoints=npoints)
 
     def _validate_limits(self, limits):
         """Validate the ``limits`` argument."""
         mspace_ndims = self.mspace_ndims
 
-        # force to numpy array
-        if not isinstance(limits, np.ndarray):
-            limits = np.array(limits, dtype=np.float64)
+        # force to numpy array, this is a no-op if limits is already
+        # a float64 array
+        limits = np.asarray(limits, dtype=np.float64)
 
         # validate
         if (
@@ -207,7 +386,13 @@ class GridLayer(BaseLayer):
             )
 
         # ensure limits go min to max
-        limits.sort(axis=1)
+        limits = np.stack(
+            (
+                np.minimum(limits[..., 0], limits[..., 1]),
+                np.maximum(limits[..., 0], limits[..., 1]),
+            ),
+            axis=-1,
+        )
 
         # repeat a single limit across all dimensions
         if limits.ndim == 1 or limits.shape[0] == 1:
@@ -216,7 +401,9 @@ class GridLayer(BaseLayer):
             if limits.ndim == 2:
                 limits = limits[0, ...]
 
-            limits = np.repeat(limits[np.newaxis, ...], mspace_ndims, axis=0)
+            limits = np.broadcast_to(
+                limits[np.newaxis, ...], (mspace_ndims, 2)
+            ).copy()
 
         return limits
 
@@ -250,10 +437,15 @@ class GridLayer(BaseLayer):
                 "All elements of 'npoints' must be a positive integer."
             )
         elif npoints.size == 1:
-            npoints = np.repeat(npoints, self.mspace_ndims)
+            npoints = np.broadcast_to(npoints, (self.mspace_ndims,)).copy()
 
         return npoints
 
+    @property
+    def dtype(self) -> np.dtype:
+        """The `~numpy.dtype` of the generated point matrix."""
+        return self._dtype
+
     @property
     def limits(self) -> np.ndarray:
         """
@@ -264,6 +456,12 @@ class GridLayer(BaseLayer):
         """
         return self.inputs["limits"]
 
+    def _set_inputs(self, **inputs):
+        """
+        Update multiple entries of :attr:`inputs` in a single pass.
+        """
+        self.inputs.update(inputs)
+
     def _set_limits(self, value):
         self.inputs["limits"] = value
 
@@ -336,6 +534,13 @@ class GridCNStepLayer(GridLayer):
         `~xarray.Dataset`.  This keyword is provided to facilitate
         functionality of composite layers.  (DEFAULT: `False`)
 
+    dtype: `~numpy.dtype`
+        The floating point `~numpy.dtype` of the generated point
+        matrix.  A lower precision type (e.g. `numpy.float32`) halves
+        the memory footprint of large grids.  This is a runtime option
+        and is not included in the layer :attr:`config`.
+        (DEFAULT: `numpy.float64`)
+
     Examples
     --------
 
@@ -393,13 +598,16 @@ class GridCNStepLayer(GridLayer):
 
     def __init__(
         self,
-        ds: xr.Dataset,
+        ds: "Dataset",
         center: List[float],
         npoints: List[int],
         step_size: List[float],
         skip_ds_add: bool = False,
+        dtype: np.dtype = np.float64,
     ):
         # assign all, and only, instance variables above the super
+        self._dtype = self._validate_dtype(dtype)
+
         super(GridLayer, self).__init__(
             ds,
             center=center,
@@ -414,29 +622,45 @@ class GridCNStepLayer(GridLayer):
         These inputs are stored in :attr:`inputs`.
         """
         center = self._validate_center(self.center)
-        self._set_center(center)
-
         npoints = self._validate_npoints(self.npoints)
-        self._set_npoints(npoints)
-
         step_size = self._validate_step_size(self.step_size)
-        self._set_step_size(step_size)
 
         # calculate limits
+        limits = self._calculate_limits(center, npoints, step_size)
+
+        self._set_inputs(
+            center=center, npoints=npoints, step_size=step_size, limits=limits
+        )
+
+    @staticmethod
+    def _calculate_limits(
+        center: np.ndarray, npoints: np.ndarray, step_size: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the grid ``limits`` from the validated ``center``,
+        ``npoints``, and ``step_size``.
+        """
+        half_size = 0.5 * (npoints - 1) * step_size
+
+        # the limits are already ordered and sized for the motion space,
+        # so there is no need to run them through _validate_limits()
+        if np.any(half_size == 0):
+            raise ValueError(
+                "The combination of 'npoints' and 'step_size' results in "
+                "a grid with zero extent along some dimensions."
+            )
+
         limits = np.empty((center.size, 2), dtype=np.float64)
-        limits[..., 1] = 0.5 * (npoints - 1) * step_size
-        limits[..., 0] = -limits[..., 1]
-        limits = limits + center[..., None]
-        limits = self._validate_limits(limits)
-        self._set_limits(limits)
+        limits[..., 0] = center - half_size
+        limits[..., 1] = center + half_size
+        return limits
 
     def _validate_center(self, center):
         """Validate the ``center`` argument."""
         mspace_ndims = self.mspace_ndims
 
-        # force into numpy array
-        if not isinstance(center, np.ndarray):
-            center = np.array(center, dtype=np.float64).squeeze()
+        # force to a 1D numpy array
+        center = np.asarray(center, dtype=np.float64).reshape(-1)
 
         # validate
         if (
@@ -449,11 +673,6 @@ class GridCNStepLayer(GridLayer):
                 f"Keyword 'center' has dtype {center.dtype}, but "
                 f"expected an integer or float dtype."
             )
-        elif center.ndim != 1:
-            raise ValueError(
-                f"Argument 'center' is a 1D array-like object, got a "
-                f"{center.ndim}D array."
-            )
         elif center.size != mspace_ndims:
             raise ValueError(
                 f"Argument 'center' does not have the same "
@@ -467,9 +686,8 @@ class GridCNStepLayer(GridLayer):
         """Validate the ``step_size`` argument."""
         mspace_ndims = self.mspace_ndims
 
-        # force to numpy array
-        if not isinstance(step_size, np.ndarray):
-            step_size = np.array(step_size, dtype=np.float64).squeeze()
+        # force to a 1D numpy array
+        step_size = np.asarray(step_size, dtype=np.float64).reshape(-1)
 
         # validate
         if (
@@ -482,11 +700,6 @@ class GridCNStepLayer(GridLayer):
                 f"Keyword 'step_size' has dtype {step_size.dtype}, but "
                 f"expected an integer or float dtype."
             )
-        elif step_size.ndim != 1:
-            raise ValueError(
-                "Argument 'step_size' needs to be 1D array-like, got "
-                f"{step_size.ndim}D array like."
-            )
         elif step_size.size not in (1, mspace_ndims):
             raise ValueError(
                 "Argument 'step_size' must be of size 1 or equal to the "
@@ -494,7 +707,7 @@ class GridCNStepLayer(GridLayer):
                 f" got size {step_size.size}."
             )
         elif step_size.size == 1:
-            step_size = np.repeat(step_size, self.mspace_ndims)
+            step_size = np.broadcast_to(step_size, (self.mspace_ndims,))
 
         # ensure all values of step_size are position
         step_size = np.abs(step_size)
@@ -558,6 +771,13 @@ class GridCNSizeLayer(GridCNStepLayer):
         `~xarray.Dataset`.  This keyword is provided to facilitate
         functionality of composite layers.  (DEFAULT: `False`)
 
+    dtype: `~numpy.dtype`
+        The floating point `~numpy.dtype` of the generated point
+        matrix.  A lower precision type (e.g. `numpy.float32`) halves
+        the memory footprint of large grids.  This is a runtime option
+        and is not included in the layer :attr:`config`.
+        (DEFAULT: `numpy.float64`)
+
     Examples
     --------
 
@@ -614,13 +834,16 @@ class GridCNSizeLayer(GridCNStepLayer):
 
     def __init__(
         self,
-        ds: xr.Dataset,
+        ds: "Dataset",
         center: List[float],
         npoints: List[int],
         size: List[float],
         skip_ds_add: bool = False,
+        dtype: np.dtype = np.float64,
     ):
         # assign all, and only, instance variables above the super
+        self._dtype = self._validate_dtype(dtype)
+
         super(GridLayer, self).__init__(
             ds,
             center=center,
@@ -635,34 +858,30 @@ class GridCNSizeLayer(GridCNStepLayer):
         These inputs are stored in :attr:`inputs`.
         """
         center = self._validate_center(self.center)
-        self._set_center(center)
-
         npoints = self._validate_npoints(self.npoints)
-        self._set_npoints(npoints)
-
         size = self._validate_size(self.size)
-        self._set_size(size)
 
         # calculate step_size
         step_size = size / (npoints - 1)
         step_size = self._validate_step_size(step_size)
-        self._set_step_size(step_size)
 
         # calculate limits
-        limits = np.empty((center.size, 2), dtype=np.float64)
-        limits[..., 1] = 0.5 * (npoints - 1) * step_size
-        limits[..., 0] = -limits[..., 1]
-        limits = limits + center[..., None]
-        limits = self._validate_limits(limits)
-        self._set_limits(limits)
+        limits = self._calculate_limits(center, npoints, step_size)
+
+        self._set_inputs(
+            center=center,
+            npoints=npoints,
+            size=size,
+            step_size=step_size,
+            limits=limits,
+        )
 
     def _validate_size(self, size):
         """Validate the ``size`` argument."""
         mspace_ndims = self.mspace_ndims
 
-        # force into numpy array
-        if not isinstance(size, np.ndarray):
-            size = np.array(size, dtype=np.float64).squeeze()
+        # force to a 1D numpy array
+        size = np.asarray(size, dtype=np.float64).reshape(-1)
 
         # validate
         if (
@@ -675,11 +894,6 @@ class GridCNSizeLayer(GridCNStepLayer):
                 f"Keyword 'size' has dtype {size.dtype}, but "
                 f"expected an integer or float dtype."
             )
-        elif size.ndim != 1:
-            raise ValueError(
-                "Argument 'size' needs to be 1D array-like, got "
-                f"{size.ndim}D array like."
-            )
         elif size.size not in (1, mspace_ndims):
             raise ValueError(
                 "Argument 'size' must be of size 1 or equal to the "
@@ -687,7 +901,7 @@ class GridCNSizeLayer(GridCNStepLayer):
                 f" got size {size.size}."
             )
         elif size.size == 1:
-            size = np.repeat(size, self.mspace_ndims)
+            size = np.broadcast_to(size, (self.mspace_ndims,))
 
         # ensure all values of size are position
         size = np.abs(size)
@@ -384,12 +384,15 @@ class BaseTransform(ABC):
 
         matrix = self.matrix(points, to_coords=to_coords)
 
-        # add in extra dimension for the translation axis
-        points = np.concatenate(
-            (points, np.ones((points.shape[0], 1))),
-            axis=1,
+        # The homogeneous coordinate of points is always 1 and the last
+        # row of the matrix is dropped from the result, so apply the
+        # matrix as its M x M linear part plus its translation column.
+        # This avoids building (N, M+1) homogeneous points and the
+        # multiplications for the discarded row.
+        return (
+            np.einsum("kmn,kn->km", matrix[:, :-1, :-1], points)
+            + matrix[:, :-1, -1]
         )
-        return np.einsum("kmn,kn->km", matrix, points)[..., :-1]
 
     @abstractmethod
     def _matrix_to_drive(self, points):
@@ -2,14 +2,92 @@
 __all__ = ["LaPDXYTransform"]
 __transformer__ = ["LaPDXYTransform"]
 
+import math
 import numpy as np
 
+from functools import lru_cache
 from typing import Any, Dict, Tuple, Union
 from warnings import warn
 
 from bapsf_motion.transform import base
 from bapsf_motion.transform.helpers import register_transform
 from bapsf_motion.transform.lapd_droop import LaPDXYDroopCorrect, DroopCorrectABC
+from bapsf_motion.utils.numba_ import HAS_NUMBA, njit, prange
+
+#: Number of points above which the `numba` compiled kernels are used
+#: to generate the `LaPDXYTransform` matrices.  Below this the call
+#: overhead outweighs the savings over `numpy`.
+_NUMBA_MATRIX_THRESHOLD = 100
+
+
+@njit(cache=True, parallel=True, error_model="numpy")
+def _fill_matrix_to_drive(points, polarity, p2c, p2d, pao, signs, out):
+    """
+    Fill ``out`` (shape ``(N, 3, 3)``) with the motion space to drive
+    transformation matrices for ``points`` (shape ``(N, 2)``).  This
+    mirrors `LaPDXYTransform._matrix_to_drive` in a single pass.
+    """
+    for ii in prange(points.shape[0]):
+        px = polarity[0] * points[ii, 0]
+        py = polarity[1] * points[ii, 1]
+
+        dx = px + p2c
+        radius = math.hypot(py, dx)
+
+        out[ii, 0, 0] = 0.0
+        out[ii, 0, 1] = 0.0
+        out[ii, 0, 2] = signs[0, 2] * (radius - p2c)
+        out[ii, 1, 0] = 0.0
+        out[ii, 1, 1] = 0.0
+        out[ii, 1, 2] = signs[1, 2] * (
+            -p2d * py / dx + pao * (1 - radius / abs(dx))
+        )
+        out[ii, 2, 0] = 0.0
+        out[ii, 2, 1] = 0.0
+        out[ii, 2, 2] = 1.0
+
+
+@njit(cache=True, parallel=True, error_model="numpy")
+def _fill_matrix_to_motion_space(points, polarity, p2c, p2d, pao, signs, out):
+    """
+    Fill ``out`` (shape ``(N, 3, 3)``) with the drive to motion space
+    transformation matrices for ``points`` (shape ``(N, 2)``).  This
+    mirrors `LaPDXYTransform._matrix_to_motion_space` in a single pass.
+    """
+    for ii in prange(points.shape[0]):
+        py = polarity[1] * points[ii, 1]
+
+        dy = py - pao
+        hyp_sq = p2d**2 + dy**2
+        leg = np.sqrt(hyp_sq - pao**2)
+        cos_theta = (p2d * leg - pao * dy) / hyp_sq
+        sin_theta = -(dy * leg + pao * p2d) / hyp_sq
+
+        out[ii, 0, 0] = signs[0, 0] * cos_theta
+        out[ii, 0, 1] = 0.0
+        out[ii, 0, 2] = signs[0, 2] * (-p2c * (1 - cos_theta))
+        out[ii, 1, 0] = signs[1, 0] * sin_theta
+        out[ii, 1, 1] = 0.0
+        out[ii, 1, 2] = signs[1, 2] * p2c * sin_theta
+        out[ii, 2, 0] = 0.0
+        out[ii, 2, 1] = 0.0
+        out[ii, 2, 2] = 1.0
+
+
+def _memoize_single_point(kernel_method, maxsize=256):
+    """
+    Wrap ``kernel_method`` into a LRU cached function of a single
+    point's ``(e0, e1)`` coordinates.  The cached matrices are made
+    read-only since they are shared between calls, callers must hand
+    out copies.
+    """
+    @lru_cache(maxsize=maxsize)
+    def single_point_matrix(e0: float, e1: float) -> np.ndarray:
+        matrix = kernel_method(np.array([[e0, e1]]))
+        matrix.flags.writeable = False
+        return matrix
+
+    return single_point_matrix
 
 
 @register_transform
@@ -241,13 +319,13 @@ class LaPDXYTransform(base.BaseTransform):
 
             # 1. convert to ball valve coords
             _sign = 1 if self.deployed_side == "East" else -1
-            points[..., 0] = np.absolute(_sign * self.pivot_to_center - points[..., 0])
+            points[..., 0] = np.absolute(_sign * self._pivot_to_center - points[..., 0])
 
             # 2. droop correct to non-droop coords
             points = self.droop_correct(points, to_points="non-droop")
 
             # 3. back to LaPD coords
-            points[..., 0] = _sign * (self.pivot_to_center - points[..., 0])
+            points[..., 0] = _sign * (self._pivot_to_center - points[..., 0])
 
         tr_points = super().__call__(points=points, to_coords=to_coords)
             
@@ -257,14 +335,14 @@ class LaPDXYTransform(base.BaseTransform):
             # 1. convert to ball valve coords
             _sign = 1 if self.deployed_side == "East" else -1
             tr_points[..., 0] = np.absolute(
-                _sign * self.pivot_to_center - tr_points[..., 0]
+                _sign * self._pivot_to_center - tr_points[..., 0]
             )
 
             # 2. droop correct to droop coords
             tr_points = self.droop_correct(tr_points, to_points="droop")
 
             # 3. back to LaPD coords
-            tr_points[..., 0] = _sign * (self.pivot_to_center - tr_points[..., 0])
+            tr_points[..., 0] = _sign * (self._pivot_to_center - tr_points[..., 0])
 
         return tr_points
 
@@ -315,6 +393,37 @@ class LaPDXYTransform(base.BaseTransform):
                 )
             inputs[key] = polarity
 
+        # cache constants used by the coordinate transformation as plain
+        # floats, so the hot path avoids the property and dict lookups
+        self._pivot_to_center = float(inputs["pivot_to_center"])
+        self._pivot_to_drive = float(inputs["pivot_to_drive"])
+        self._probe_axis_offset = float(inputs["probe_axis_offset"])
+        self._drive_polarity_f = inputs["drive_polarity"].astype(np.float64)
+        self._mspace_polarity_f = inputs["mspace_polarity"].astype(np.float64)
+
+        # Multiplying by the diagonal polarity matrices on either side
+        # of T0 (i.e. T_dpolarity @ T0 @ T_mpolarity) only flips the
+        # signs of T0's elements, so fold both polarities into a single
+        # 3x3 sign matrix per direction.  (If the polarity matrices
+        # ever become non-diagonal, apply them with in-place
+        # np.matmul(..., out=T0) calls rather than nested matmul calls
+        # to avoid the intermediate (N, 3, 3) arrays.)
+        dpolarity = np.append(self._drive_polarity_f, 1.0)
+        mpolarity = np.append(self._mspace_polarity_f, 1.0)
+        self._to_drive_signs = np.outer(dpolarity, mpolarity)
+        self._to_mspace_signs = np.outer(mpolarity, dpolarity)
+
+        # A single point (e.g. jogging the probe drive or revisiting
+        # waypoints of a scan) goes through the scalar kernels, since
+        # they avoid the numpy call overhead even when not JIT
+        # compiled, and the resulting matrices are memoized.
+        self._single_matrix_to_drive = _memoize_single_point(
+            self._kernel_matrix_to_drive
+        )
+        self._single_matrix_to_motion_space = _memoize_single_point(
+            self._kernel_matrix_to_motion_space
+        )
+
         if not isinstance(inputs["droop_correct"], bool):
             raise TypeError(
                 f"Keyword 'droop_correct' expected type bool, "
@@ -330,43 +439,92 @@ class LaPDXYTransform(base.BaseTransform):
 
         return inputs
 
+    def _kernel_matrix_to_drive(self, points: np.ndarray) -> np.ndarray:
+        T0 = np.empty((points.shape[0], 3, 3))
+        _fill_matrix_to_drive(
+            points,
+            self._mspace_polarity_f,
+            self._pivot_to_center,
+            self._pivot_to_drive,
+            self._probe_axis_offset,
+            self._to_drive_signs,
+            T0,
+        )
+        return T0
+
+    def _kernel_matrix_to_motion_space(self, points: np.ndarray) -> np.ndarray:
+        T0 = np.empty((points.shape[0], 3, 3))
+        _fill_matrix_to_motion_space(
+            points,
+            self._drive_polarity_f,
+            self._pivot_to_center,
+            self._pivot_to_drive,
+            self._probe_axis_offset,
+            self._to_mspace_signs,
+            T0,
+        )
+        return T0
+
     def _matrix_to_drive(self, points):
         # given points are in motion space "LaPD" (x, y) coordinates
+        if points.shape[0] == 1:
+            # copy, so callers never share the cached (read-only) matrix
+            return self._single_matrix_to_drive(*points[0].tolist()).copy()
+        elif HAS_NUMBA and points.shape[0] > _NUMBA_MATRIX_THRESHOLD:
+            return self._kernel_matrix_to_drive(points)
+
+        p2c = self._pivot_to_center
+        p2d = self._pivot_to_drive
+        pao = self._probe_axis_offset
 
         # polarity needs to be adjusted first, since the parameters for
         # the following transformation matrices depend on the adjusted
-        # coordinate space
-        points = self.mspace_polarity * points  # type: np.ndarray
+        # coordinate space (the polarity is applied per column so no
+        # polarity adjusted copy of points is made)
+        polarity = self._mspace_polarity_f
+        x = polarity[0] * points[..., 0]
+        y = polarity[1] * points[..., 1]
         npoints = points.shape[0]
 
-        tan_theta = points[..., 1] / (points[..., 0] + self.pivot_to_center)
-        theta = -np.arctan(tan_theta)
-
-        T0 = np.zeros((npoints, 3, 3)).squeeze()
-        T0[..., 0, 2] = np.sqrt(
-            points[..., 1]**2 + (self.pivot_to_center + points[..., 0])**2
-        ) - self.pivot_to_center
-        T0[..., 1, 2] = (
-            self.pivot_to_drive * np.tan(theta)
-            + self.probe_axis_offset * (1 - (1 / np.cos(theta)))
+        # theta = -arctan(y / dx) is the angle of the probe shaft from
+        # the horizontal, so tan(theta) = -y / dx and
+        # 1 / cos(theta) = radius / |dx| can be had without any trig
+        dx = x + p2c
+        radius = np.hypot(y, dx)
+
+        # only the translation column of T0 is populated, write every
+        # element explicitly instead of zero-filling the whole array and
+        # fold the polarity signs into the populated elements instead of
+        # sign flipping all of T0
+        signs = self._to_drive_signs
+        T0 = np.empty((npoints, 3, 3))
+        T0[..., :2] = 0.0
+        T0[..., 0, 2] = signs[0, 2] * (radius - p2c)
+        T0[..., 1, 2] = signs[1, 2] * (
+            -p2d * y / dx
+            + pao * (1 - radius / np.abs(dx))
         )
         T0[..., 2, 2] = 1.0
 
-        T_dpolarity = np.diag(self.drive_polarity.tolist() + [1.0])
-        T_mpolarity = np.diag(self.mspace_polarity.tolist() + [1.0])
-
-        return np.matmul(
-            T_dpolarity,
-            np.matmul(T0, T_mpolarity),
-        )
+        return T0
 
     def _matrix_to_motion_space(self, points: np.ndarray):
         # given points are in drive (e0, e1) coordinates
+        if points.shape[0] == 1:
+            # copy, so callers never share the cached (read-only) matrix
+            return self._single_matrix_to_motion_space(*points[0].tolist()).copy()
+        elif HAS_NUMBA and points.shape[0] > _NUMBA_MATRIX_THRESHOLD:
+            return self._kernel_matrix_to_motion_space(points)
+
+        p2c = self._pivot_to_center
+        p2d = self._pivot_to_drive
+        pao = self._probe_axis_offset
 
         # polarity needs to be adjusted first, since the parameters for
         # the following transformation matrices depend on the adjusted
-        # coordinate space
-        points = self.drive_polarity * points  # type: np.ndarray
+        # coordinate space (only e1 is needed, so just that column is
+        # polarity adjusted)
+        e1 = self._drive_polarity_f[1] * points[..., 1]
         npoints = points.shape[0]
 
         # Angle Defs:
@@ -375,34 +533,37 @@ class LaPDXYTransform(base.BaseTransform):
         #          point on e1 (the vertical axis)
         # - alpha = beta - theta
 
-        sine_alpha = self.probe_axis_offset / np.sqrt(
-            self.pivot_to_drive**2
-            + (-self.probe_axis_offset + points[..., 1])**2
-        )
-
-        tan_beta = (-self.probe_axis_offset + points[..., 1]) / -self.pivot_to_drive
-
         # alpha = arcsine( sine_alpha )
-        # beta = pi + arctan( tan_beta )
+        # beta = pi + arctan( tan_beta ),  tan_beta = -dy / p2d
         # theta = beta - alpha
         # theta2 = theta - pi
-
-        theta = np.arctan(tan_beta) - np.arcsin(sine_alpha)
-
-        T0 = np.zeros((npoints, 3, 3)).squeeze()
-        T0[..., 0, 0] = np.cos(theta)
-        T0[..., 0, 2] = -self.pivot_to_center * (1 - np.cos(theta))
-        T0[..., 1, 0] = np.sin(theta)
-        T0[..., 1, 2] = self.pivot_to_center * np.sin(theta)
+        #
+        # With hyp = sqrt(p2d**2 + dy**2) and leg = sqrt(hyp**2 - pao**2)
+        #   cos(beta) = p2d / hyp,  sin(beta) = -dy / hyp
+        #   cos(alpha) = leg / hyp,  sin(alpha) = pao / hyp
+        # so cos(theta) and sin(theta) follow from the angle difference
+        # identities without evaluating any trig functions.
+
+        dy = e1 - pao
+        hyp_sq = p2d**2 + dy**2
+        leg = np.sqrt(hyp_sq - pao**2)
+
+        cos_theta = (p2d * leg - pao * dy) / hyp_sq
+        sin_theta = -(dy * leg + pao * p2d) / hyp_sq
+
+        # the polarity signs are folded into the populated elements,
+        # instead of sign flipping all of T0
+        signs = self._to_mspace_signs
+        T0 = np.empty((npoints, 3, 3))
+        T0[..., 1] = 0.0
+        T0[..., 0, 0] = signs[0, 0] * cos_theta
+        T0[..., 0, 2] = (-signs[0, 2] * p2c) * (1 - cos_theta)
+        T0[..., 1, 0] = signs[1, 0] * sin_theta
+        T0[..., 1, 2] = (signs[1, 2] * p2c) * sin_theta
+        T0[..., 2, 0] = 0.0
         T0[..., 2, 2] = 1.0
 
-        T_dpolarity = np.diag(self.drive_polarity.tolist() + [1.0])
-        T_mpolarity = np.diag(self.mspace_polarity.tolist() + [1.0])
-
-        return np.matmul(
-            T_mpolarity,
-            np.matmul(T0, T_dpolarity),
-        )
+        return T0
 
     @property
     def pivot_to_center(self) -> float:
@@ -12,6 +12,7 @@ __all__ = [
     "dict_equal"
 ]
 import asyncio
+import importlib
 import re
 import time
 
@@ -19,7 +20,7 @@ from astropy import units
 from collections import UserDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from bapsf_motion.utils import exceptions, toml
 from bapsf_motion.utils.units_ import units, counts, steps, rev
@@ -28,33 +29,34 @@ _HERE = Path(__file__).resolve().parent
 _EXAMPLES = (_HERE / ".." / "examples").resolve()
 
 #: Regular expression pattern for parsing IPv4 addresses
-ipv4_pattern = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+ipv4_pattern = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", re.ASCII)
 
 
 class SimpleSignal:
-    _handlers = None
+    # handlers are stored as a tuple and replaced on (dis)connect, so
+    # emit() can iterate them directly even if a handler disconnects
+    # during the emit
+    _handlers = ()
 
     @property
     def handlers(self):
-        if self._handlers is None:
-            self._handlers = []
-        return self._handlers
+        return list(self._handlers)
 
     def connect(self, func):
-        if func not in self.handlers:
-            self.handlers.append(func)
+        if func not in self._handlers:
+            self._handlers = self._handlers + (func,)
 
     def disconnect(self, func=None):
-        try:
-            self.handlers.remove(func)
-        except ValueError:
-            pass
+        if func in self._handlers:
+            self._handlers = tuple(
+                handler for handler in self._handlers if handler != func
+            )
 
     def disconnect_all(self):
-        self._handlers = None
+        self._handlers = ()
 
     def emit(self):
-        for handler in self.handlers:
+        for handler in self._handlers:
             handler()
 
 
@@ -96,6 +98,55 @@ def load_example(filename: str, as_string=False):
     return config
 
 
+def _lazy_attributes(
+    package: str, attributes: Dict[str, str], namespace: Dict[str, Any]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module level ``__getattr__`` and ``__dir__`` functions
+    (:pep:`562`) that lazily import the attributes of package
+    ``package``.
+
+    Parameters
+    ----------
+    package: `str`
+        Name of the package, i.e. its ``__name__``.
+
+    attributes: `dict`
+        Mapping of the lazily imported attribute names to the name of
+        the sub-module (relative to ``package``) that defines them.
+
+    namespace: `dict`
+        The package namespace, i.e. its ``globals()``.  Imported
+        attributes are cached here so ``__getattr__`` is only hit
+        once per attribute.
+
+    Returns
+    -------
+    `tuple`
+        The ``(__getattr__, __dir__)`` functions for the package.
+    """
+
+    def __getattr__(name: str):
+        try:
+            module_name = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+
+        module = importlib.import_module(f"{package}.{module_name}")
+        value = getattr(module, name)
+
+        # cache on the package so __getattr__ is not hit again
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
+
+
 def _deepcopy_dict(item):
     _copy = {}
     for key, val in item.items():
@@ -0,0 +1,34 @@
+"""
+Module for optional `numba` functionality.
+
+`numba` is not a required dependency of `bapsf_motion`.  This module
+wrangles its import so the rest of `bapsf_motion` can define
+just-in-time (JIT) compiled kernels unconditionally and then check
+:data:`HAS_NUMBA` to decide if the compiled kernel or a pure `numpy`
+implementation should be used.
+"""
+__all__ = ["HAS_NUMBA", "njit", "prange"]
+
+try:
+    from numba import njit, prange
+
+    #: `True` if `numba` is installed, `False` otherwise.
+    HAS_NUMBA = True
+except (ModuleNotFoundError, ImportError):
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for `numba.njit` when `numba` is not installed.  The
+        decorated function is returned unchanged.
+        """
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    #: Stand-in for `numba.prange` when `numba` is not installed.
+    prange = range
@@ -35,20 +35,34 @@ def as_toml_string(config):
     strings.  This is required because `dumps` can not handle non-string
     keys.
     """
-    def convert_key_to_string(_d):
-        _config = {}
-        for key, value in _d.items():
-            if isinstance(value, (dict, UserDict)):
-                value = convert_key_to_string(value)
+    return dumps(_convert_keys_to_string(config))
 
-            if not isinstance(key, str):
-                key = f"{key}"
 
-            _config[key] = value
+def _convert_keys_to_string(_d):
+    """
+    Return ``_d`` with all (nested) keys converted to strings and all
+    nested `~collections.UserDict` converted to `dict`.  Only the
+    (sub-)dictionaries that need a conversion are copied, everything
+    else is passed through as is.
+    """
+    converted = {}
+    for key, value in _d.items():
+        if isinstance(value, (dict, UserDict)):
+            new_value = _convert_keys_to_string(value)
+            if new_value is not value:
+                converted[key] = new_value
 
-        return _config
+    if (
+        not converted
+        and isinstance(_d, dict)
+        and all(isinstance(key, str) for key in _d)
+    ):
+        return _d
 
-    return dumps(convert_key_to_string(config))
+    return {
+        key if isinstance(key, str) else f"{key}": converted.get(key, value)
+        for key, value in _d.items()
+    }
 
 
 # cleanup namespace